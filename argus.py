@@ -50,7 +50,7 @@ option_dict = vars(options)
 
 if hasattr(options, 'verbose'):
     utils.debug = True
-    utils.argus_log = open('argus.log', 'w')
+    utils.open_argus_log()
 
 Config.init_argus()
 
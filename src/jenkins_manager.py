@@ -25,7 +25,7 @@ from src.jenkins_job import JenkinsJob, JenkinsTest
 from src.jenkins_report import JenkinsReport
 from src.utils import (Config, ConfigError, display_results, get_connection_name, get_input, is_yes,
                        jenkins_conf_file, jenkins_data_dir, jenkins_views_dir,
-                       pause, pick_value, save_argus_config)
+                       list_files, pause, pick_value, save_argus_config)
 
 if TYPE_CHECKING:
     from src.main_menu import MainMenu
@@ -91,8 +91,7 @@ class JenkinsManager:
                     JenkinsConnection.load_connection_config(self, connection_name)
 
                 # Load cached job data from jenkins_data_dir
-                for file_name in os.listdir(jenkins_data_dir):
-                    data_file = os.path.join(jenkins_data_dir, file_name)
+                for data_file in list_files(jenkins_data_dir, '.dat'):
                     print('Loading locally cached Jenkins job data from file: {}'.format(data_file))
                     jenkins_connection = self.load_job_data(data_file)
                     if jenkins_connection is not None:
@@ -183,7 +182,7 @@ class JenkinsManager:
             self._main_menu.go_to_jenkins_report_menu()
 
     def remove_custom_report(self) -> None:
-        report_name = pick_value('Which custom report would you like to remove?', list(self.jenkins_reports.keys()))
+        report_name = pick_value('Which custom report would you like to remove?', self.jenkins_reports.keys())
         if report_name:
             self.jenkins_reports.pop(report_name)
             self.save_jenkins_config()
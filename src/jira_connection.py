@@ -15,6 +15,7 @@
 import configparser
 import itertools
 import os
+import sys
 import traceback
 from typing import TYPE_CHECKING, List, Optional, Dict
 
@@ -44,7 +45,8 @@ class JiraConnection:
     def __init__(self, connection_name='unknown', url='unknown', user_name='unknown', password='unknown') -> None:
         self.possible_projects = []  # type: List[str]
 
-        self.connection_name = connection_name
+        # Interned to match the interned connection names held by JiraUserName for cheap dict key comparisons
+        self.connection_name = sys.intern(connection_name)
         self._url = url.rstrip('/')
         self._user = user_name
         self._pass = password
@@ -137,13 +137,13 @@ class JiraDashboard:
         while cmd != 'q':
             cmd = get_input('[A]dd a view, [R]emove a view, [Q]uit:')
             if cmd == 'r':
-                to_remove = pick_value('Remove which view?', list(self._jira_views.keys()), True, 'Cancel')
+                to_remove = pick_value('Remove which view?', self._jira_views.keys(), True, 'Cancel')
                 if to_remove is None:
                     continue
                 all_views.update({to_remove: self._jira_views[to_remove]})
                 self._jira_views.pop(to_remove)
             elif cmd == 'a':
-                to_add = pick_value('Add which view?', list(all_views.keys()), True, 'Cancel')
+                to_add = pick_value('Add which view?', all_views.keys(), True, 'Cancel')
                 if to_add is None:
                     continue
                 self._jira_views[to_add] = all_views[to_add]
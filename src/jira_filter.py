@@ -15,6 +15,7 @@
 from configparser import RawConfigParser
 from typing import TYPE_CHECKING, List, Optional
 
+from src import utils
 from src.utils import argus_debug, get_input, pick_value
 
 if TYPE_CHECKING:
@@ -100,8 +101,9 @@ class JiraFilter:
         jira_project = self._jira_connection.maybe_get_cached_jira_project(jira_issue.project_name)
         if jira_project is None:
             return 'None'
-        argus_debug('JiraFilter: Attempting to translate {} for jira_issue: {}'.format(
-            self.field, jira_issue.issue_key))
+        if utils.debug:
+            argus_debug('JiraFilter: Attempting to translate {} for jira_issue: {}'.format(
+                self.field, jira_issue.issue_key))
         return jira_project.translate_custom_field(self.field)
 
     def _internal_matching_operation(self, jira_issue: 'JiraIssue', to_match: List[str]) -> bool:
@@ -110,18 +112,22 @@ class JiraFilter:
 
         translated = self._translate_field(jira_issue)
         in_issue = translated in jira_issue
-        value = 'Not found'
-        if in_issue:
-            value = jira_issue[translated]
-        argus_debug('Checking for translated field {} in issue: {}. Found: {}. Value: {}. Filter: {}'.format(
-            translated, jira_issue.issue_key, in_issue, value, self))
+        # Per-issue hot path: only build debug strings when debugging is on
+        debug = utils.debug
+        if debug:
+            value = jira_issue[translated] if in_issue else 'Not found'
+            argus_debug('Checking for translated field {} in issue: {}. Found: {}. Value: {}. Filter: {}'.format(
+                translated, jira_issue.issue_key, in_issue, value, self))
 
-        if translated in jira_issue:
-            argus_debug('Checking for {} in {}'.format(translated, jira_issue.issue_key))
+        if in_issue:
+            if debug:
+                argus_debug('Checking for {} in {}'.format(translated, jira_issue.issue_key))
             for match in to_match:
-                argus_debug('Checking against match: {}'.format(match))
+                if debug:
+                    argus_debug('Checking against match: {}'.format(match))
                 if match in jira_issue[translated]:
-                    argus_debug('   FOUND MATCH')
+                    if debug:
+                        argus_debug('   FOUND MATCH')
                     matches_one = True
                 else:
                     matches_all = False
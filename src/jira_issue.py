@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
 import os
 import pickle
 import re
@@ -21,6 +22,7 @@ import six
 from jira import Issue
 from jira.resources import Version
 
+from src import time_utils
 from src.jira_dependency import JiraDependency
 from src.utils import ConfigError
 
@@ -29,6 +31,9 @@ if TYPE_CHECKING:
     from src.jira_manager import JiraManager
     from src.jira_project import JiraProject
 
+# Marks a lazily computed JiraIssue attribute that hasn't been worked out yet, where None is a valid result
+_UNSET = object()
+
 
 class JiraIssue(dict):
 
@@ -175,6 +180,34 @@ class JiraIssue(dict):
         # JIRA lib in python uses resolutiondate instead of resolved. argh.
         return None if 'resolutiondate' not in self else self['resolutiondate']
 
+    @property
+    def resolved_datetime(self) -> Optional[datetime.datetime]:
+        """
+        resolved parsed to a datetime, or None if the issue is open or has no resolution date. Worked out on first access
+        and kept on the issue, as time-bound reports check it once per column per report run.
+        """
+        result = self.__dict__.get('_resolved_datetime', _UNSET)
+        if result is _UNSET:
+            resolved = self.resolved
+            if self.is_open or resolved is None or resolved == 'None':
+                result = None
+            else:
+                result = time_utils.parse_jira_time(resolved)
+            self._resolved_datetime = result
+        return result
+
+    @property
+    def resolved_timestamp(self) -> Optional[float]:
+        """
+        resolved_datetime as a POSIX timestamp, for float comparisons against report time bounds. Kept on the issue as above.
+        """
+        result = self.__dict__.get('_resolved_timestamp', _UNSET)
+        if result is _UNSET:
+            resolved = self.resolved_datetime
+            result = None if resolved is None else resolved.timestamp()
+            self._resolved_timestamp = result
+        return result
+
     @property
     def assignee(self) -> Optional[str]:
         # Don't have to use get_field for non-custom fields, so no need for a JiraConnection
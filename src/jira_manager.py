@@ -30,7 +30,7 @@ from src.jira_issue import JiraIssue
 from src.jira_view import JiraView
 from src.utils import (ConfigError, argus_debug, clear, get_input, is_empty,
                        is_yes, jira_conf_file, pause, pick_value, print_separator,
-                       save_argus_config, jira_project_dir, Config)
+                       save_argus_config, jira_project_dir, list_files, Config)
 
 if TYPE_CHECKING:
     from src.team_manager import TeamManager
@@ -109,8 +109,7 @@ class JiraManager:
                     self.jira_dashboards[dash] = JiraDashboard(dash, dash_views)
 
         # Initialize JiraProjects from locally cached files
-        for file_name in os.listdir(jira_project_dir):
-            full_path = os.path.join(jira_project_dir, file_name)
+        for full_path in list_files(jira_project_dir, '.cfg'):
             print('Processing locally cached JiraProject: {}'.format(full_path))
             # Init based on matching the name of this connection and .cfg
             print_separator(30)
@@ -236,7 +235,7 @@ class JiraManager:
         """
         Removes an existing url/user/pass JIRA connection and the corresponding Jira object
         """
-        selection = pick_value('Remove which jira connection? ', list(self._jira_connections.keys()), True, 'Cancel')
+        selection = pick_value('Remove which jira connection? ', self._jira_connections.keys(), True, 'Cancel')
         if selection is None:
             return
         print('About to delete: {}, all related views, and all offline cached JiraProject data.'.format(selection))
@@ -248,9 +247,10 @@ class JiraManager:
             self._save_config()
 
     def get_jira_connection(self, connection_name: str) -> JiraConnection:
-        if connection_name not in list(self._jira_connections.keys()):
+        jira_connection = self._jira_connections.get(connection_name)
+        if jira_connection is None:
             raise ConfigError('Failed to find connection: {}'.format(connection_name))
-        return self._jira_connections[connection_name]
+        return jira_connection
 
     def get_jira_issue(self, jira_issue_key: str) -> Optional[JiraIssue]:
         """
@@ -276,7 +276,7 @@ class JiraManager:
             print('   {}'.format(jira_view))
 
     def display_view(self) -> None:
-        view_name = pick_value('Which view?', list(self.jira_views.keys()), True, 'Back')
+        view_name = pick_value('Which view?', self.jira_views.keys(), True, 'Back')
         if view_name is None:
             return
         self.jira_views[view_name].display_view(self)
@@ -289,7 +289,7 @@ class JiraManager:
             else:
                 return None
         view_name = get_input('Name this view:')
-        jira_connection_name = pick_value('Which JIRA Connection does this belong to?', list(self._jira_connections.keys()))
+        jira_connection_name = pick_value('Which JIRA Connection does this belong to?', self._jira_connections.keys())
         if jira_connection_name is None:
             return
         new_view = JiraView(view_name, self._jira_connections[jira_connection_name])
@@ -303,7 +303,7 @@ class JiraManager:
                 self.add_view()
             else:
                 return
-        view_name = pick_value('Select a view to edit', list(self.jira_views.keys()))
+        view_name = pick_value('Select a view to edit', self.jira_views.keys())
         if view_name is None:
             return
         view = self.jira_views[view_name]
@@ -319,7 +319,7 @@ class JiraManager:
         if len(self.jira_views) == 0:
             print('No views to remove.')
             return
-        to_remove = pick_value('Select a view to delete or [q]uit: ', list(self.jira_views.keys()))
+        to_remove = pick_value('Select a view to delete or [q]uit: ', self.jira_views.keys())
         if to_remove is None:
             return
 
@@ -354,7 +354,7 @@ class JiraManager:
         if len(self.jira_dashboards) == 0:
             print('No dashboards. Create one first.')
             return
-        dn = pick_value('Display which dashboard\'s results?', list(self.jira_dashboards.keys()), True, 'Cancel')
+        dn = pick_value('Display which dashboard\'s results?', self.jira_dashboards.keys(), True, 'Cancel')
         if dn is None:
             return
 
@@ -368,7 +368,7 @@ class JiraManager:
         self._save_config()
 
     def edit_dashboard(self) -> None:
-        dn = pick_value('Which dashboard?', list(self.jira_dashboards.keys()), True, 'Cancel')
+        dn = pick_value('Which dashboard?', self.jira_dashboards.keys(), True, 'Cancel')
         if dn is None:
             return
         dash = self.jira_dashboards[dn]
@@ -376,7 +376,7 @@ class JiraManager:
         self._save_config()
 
     def remove_dashboard(self) -> None:
-        dn = pick_value('Remove which dashboard?', list(self.jira_dashboards.keys()), True, 'Cancel')
+        dn = pick_value('Remove which dashboard?', self.jira_dashboards.keys(), True, 'Cancel')
         if dn is None:
             return
         prompt = get_input('About to delete [{}]. Are you sure?'.format(dn))
@@ -492,7 +492,7 @@ class JiraManager:
             cinput = get_input(
                 '[#] to open an issue in browser, [c] to clear column filters, [f] to specify a specific field to match on, [q] to return to menu:')
             if str.lower(cinput) == 'f':
-                col_name = pick_value('Filter on which column?', list(columns.keys()), False)
+                col_name = pick_value('Filter on which column?', columns.keys(), False)
                 newlist = []
                 for ji in display_list:
                     if col_name in ji:
@@ -622,7 +622,7 @@ class JiraManager:
 
     def add_label_view(self) -> None:
         name = get_input('Name this view: ')
-        jira_connection_name = pick_value('Which JIRA Connection does this belong to? ', list(self._jira_connections.keys()))
+        jira_connection_name = pick_value('Which JIRA Connection does this belong to? ', self._jira_connections.keys())
         if jira_connection_name is None:
             return
         jira_connection = self._jira_connections[jira_connection_name]
@@ -665,7 +665,7 @@ class JiraManager:
                     if to_match in fix:
                         available_versions.add(fix)
 
-        report_version = pick_value('Generate report for which FixVersion?', list(available_versions))
+        report_version = pick_value('Generate report for which FixVersion?', available_versions)
         if report_version is None:
             return
 
@@ -724,7 +724,7 @@ class JiraManager:
         if not self._prompt_connection_add_if_none():
             return None
 
-        choice = pick_value(prompt, list(self._jira_connections.keys()), True)
+        choice = pick_value(prompt, self._jira_connections.keys(), True)
         if choice is None:
             return None
 
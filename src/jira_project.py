@@ -289,9 +289,7 @@ class JiraProject:
         """
         Returns original untralsnated name if field isn't custom
         """
-        if field_name not in self._custom_fields:
-            return field_name
-        return self._custom_fields[field_name]
+        return self._custom_fields.get(field_name, field_name)
 
     def resolve_dependencies(self, jira_manager: 'JiraManager') -> None:
         """
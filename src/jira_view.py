@@ -212,7 +212,7 @@ class JiraView:
                 return
             self._teams[to_add.name] = to_add
         elif cmd == 'r':
-            tr = pick_value('Remove which team?', list(self._teams.keys()), True, 'Cancel')
+            tr = pick_value('Remove which team?', self._teams.keys(), True, 'Cancel')
             if tr is None:
                 return
             conf = get_input('About to delete {}. Are you sure?'.format(tr))
@@ -264,7 +264,7 @@ class JiraView:
         self.add_single_filter(filter_name, filter_value, filter_type, 'AND')
 
     def remove_filter(self) -> None:
-        to_remove = pick_value('Remove value from which JiraFilter?', list(self._jira_filters.keys()))
+        to_remove = pick_value('Remove value from which JiraFilter?', self._jira_filters.keys())
         if to_remove is None:
             return
         self._jira_filters[to_remove].remove_filter()
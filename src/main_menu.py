@@ -60,7 +60,7 @@ class MainMenu:
 
         if 'verbose' in options:
             utils.debug = True
-            utils.argus_log = open('argus.log', 'w')
+            utils.open_argus_log()
 
         self.main_menu = [
             MenuOption('d', 'Dashboards', self.go_to_dashboards_menu, pause=False),
@@ -313,8 +313,7 @@ class MainMenu:
         self._save_config()
 
     def _change_debug(self) -> None:
-        if utils.argus_log is None:
-            utils.argus_log = open('argus.log', 'w')
+        utils.open_argus_log()
         utils.debug = not utils.debug
 
     def _change_show_dependencies(self) -> None:
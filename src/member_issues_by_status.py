@@ -13,13 +13,13 @@
 # limitations under the License.
 
 import itertools
-from configparser import RawConfigParser
-from typing import Dict, List, Optional, TYPE_CHECKING
+import sys
+from array import array
+from typing import Dict, Iterable, List, TextIO, Tuple, TYPE_CHECKING
 
 from src.display_filter import DisplayFilter
 from src.jira_connection import JiraConnection
 from src.jira_issue import JiraIssue
-from src.jira_utils import JiraUtils
 from src.utils import pick_value
 
 if TYPE_CHECKING:
@@ -35,20 +35,34 @@ class JiraUserName:
     is uniquely identified by a: the name, b: the jira connection, and c: the team.
     """
 
+    __slots__ = ('user_name', 'jira_connection_name', 'team_name', '_hash')
+
     def __init__(self, user_name: str, jira_connection_name: str, team_name: str) -> None:
-        self.user_name = user_name
-        self.jira_connection_name = jira_connection_name
-        self.team_name = team_name
+        # Interned as these are used as dict keys on every ownership check during report population
+        self.user_name = sys.intern(user_name)
+        self.jira_connection_name = sys.intern(jira_connection_name)
+        self.team_name = sys.intern(team_name)
+        # Fields are never reassigned after construction, so the hash is computed once
+        self._hash = hash((self.user_name, self.jira_connection_name, self.team_name))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, JiraUserName):
+            return NotImplemented
+        return self._hash == other._hash and self.user_name == other.user_name \
+            and self.jira_connection_name == other.jira_connection_name and self.team_name == other.team_name
 
     @property
     def to_combined_string(self) -> str:
-        return '{}:{}:{}'.format(self.user_name, self.jira_connection_name, self.team_name)
+        return f'{self.user_name}:{self.jira_connection_name}:{self.team_name}'
 
     @classmethod
     def from_combined_string(cls, combined_string: str) -> 'JiraUserName':
         sa = combined_string.split(':')
         if len(sa) != 3:
-            raise Exception('Got bad string to JiraUserName.from_combined_string. Expected : delim with 3 members, got: {}'.format(combined_string))
+            raise Exception(f'Got bad string to JiraUserName.from_combined_string. Expected : delim with 3 members, got: {combined_string}')
         return JiraUserName(sa[0], sa[1], sa[2])
 
     def __str__(self) -> str:
@@ -61,53 +75,74 @@ class MemberIssuesByStatus:
     are cached in the object to denote the various JiraIssue ownership relationships this member has.
     """
 
+    # Status codes stored in self._status, parallel to self._issues
+    ASSIGNED = 0
+    REVIEWER = 1
+    CLOSED = 2
+    REVIEWED = 3
+
     def __init__(self, jira_user_name: JiraUserName) -> None:
         # Use to identify the primary user name. Do not include in known names list so we don't duplicate serialization
         self.primary_name = jira_user_name
 
         self._aliased_names = {}  # type: Dict[str, JiraUserName]
 
+        # Sorted alias keys for display and unique connection names, rebuilt on alias mutation
+        self._sorted_alias_keys = []  # type: List[str]
+        self._connection_names = []  # type: List[str]
+
+        # Connection name -> user names in ownership lookup order: aliases as added, then the primary name. Rebuilt on
+        # alias mutation so attach_to_owners doesn't rescan every known name per issue.
+        self._lookup_order_by_conn = {}  # type: Dict[str, Tuple[str, ...]]
+        self._refresh_alias_indexes()
+
+        # Owned issues are stored as parallel columns: the JiraIssue and its status code relative to this member.
         # WARNING: These containers also need to be reflected in self.clear and self.sort_tickets
-        self.assigned: List[JiraIssue] = []
-        self.closed: List[JiraIssue] = []
-        self.reviewer: List[JiraIssue] = []
-        self.reviewed: List[JiraIssue] = []
+        self._issues = []  # type: List[JiraIssue]
+        self._status = array('b')
+
+        # Per-status views over the columns above, built on first read and dropped when the columns change
+        self._by_status = {}  # type: Dict[int, List[JiraIssue]]
 
     def clone_empty(self) -> 'MemberIssuesByStatus':
         """
         Creates a clone of this member without any populated JiraIssues
         """
         result = MemberIssuesByStatus(self.primary_name)
-        for alias in list(self._aliased_names.values()):
+        for alias in self._aliased_names.values():
             result.add_alias(alias)
         return result
 
-    def save_config(self, config_parser: RawConfigParser) -> None:
-        config_parser.add_section(self.full_name)
-
+    def write_ini(self, config_file: TextIO) -> None:
+        """
+        Writes this member's section of the team config directly to config_file
+        """
         # Create comma delimited list of : delimited known names for this linked user
-        config_parser.set(self.full_name, 'aliases', ','.join(list(self._aliased_names.keys())))
+        config_file.write('[{}]\naliases = {}\n\n'.format(self.full_name, ','.join(self._aliased_names.keys())))
 
         # Don't need to serialize _jira_connection_names as they're a redundant ease-of-use structure
         # We do not serialize the issues we iterate over within this object
 
     @classmethod
-    def from_file(cls, root_name: str, config_parser: RawConfigParser) -> 'MemberIssuesByStatus':
+    def from_file(cls, root_name: str, options: Dict[str, str]) -> 'MemberIssuesByStatus':
+        """
+        :param options: option name to value for this member's section of the team config
+        """
         new_user = JiraUserName.from_combined_string(root_name)
         result = MemberIssuesByStatus(new_user)
 
-        tokens = config_parser.get(root_name, 'aliases')
+        tokens = options['aliases']
         if len(tokens) > 0:
-            for token in config_parser.get(root_name, 'aliases').split(','):
+            for token in tokens.split(','):
                 result.add_alias(JiraUserName.from_combined_string(token))
         return result
 
     @property
     def connection_names(self) -> List[str]:
-        result = [self.primary_name.jira_connection_name]
-        for combined_name in list(self._aliased_names.values()):
-            result.append(combined_name.jira_connection_name)
-        return result
+        """
+        Unique jira connection names across the primary name and aliases, primary first. Callers must not mutate.
+        """
+        return self._connection_names
 
     @property
     def full_name(self) -> str:
@@ -123,54 +158,113 @@ class MemberIssuesByStatus:
 
     def add_alias(self, jira_user_name: JiraUserName) -> None:
         self._aliased_names[jira_user_name.to_combined_string] = jira_user_name
+        self._refresh_alias_indexes()
 
     def remove_alias(self) -> bool:
         if len(self._aliased_names) == 0:
             print('No aliases. Returning.')
             return False
 
-        to_remove = pick_value('Remove which alias from this member?', list(self._aliased_names.keys()))
+        to_remove = pick_value('Remove which alias from this member?', self._aliased_names.keys())
         if to_remove is None:
             return False
 
         del self._aliased_names[to_remove]
+        self._refresh_alias_indexes()
         return True
 
+    def _refresh_alias_indexes(self) -> None:
+        self._sorted_alias_keys = sorted(self._aliased_names.keys())
+        self._connection_names = list(dict.fromkeys(
+            jira_user_name.jira_connection_name for jira_user_name in itertools.chain([self.primary_name], self._aliased_names.values())))
+
+        lookup_order = {}  # type: Dict[str, List[str]]
+        for jira_user_name in itertools.chain(self._aliased_names.values(), [self.primary_name]):
+            user_names = lookup_order.setdefault(jira_user_name.jira_connection_name, [])
+            if jira_user_name.user_name not in user_names:
+                user_names.append(jira_user_name.user_name)
+        self._lookup_order_by_conn = {conn: tuple(user_names) for conn, user_names in lookup_order.items()}
+
     def closed_test_count(self) -> int:
         return len([x for x in self.closed if x.is_test])
 
-    def add_if_owns(self, jira_connection: JiraConnection, jira_issue: JiraIssue) -> bool:
+    def attach(self, jira_issue: JiraIssue, as_reviewer: bool) -> None:
         """
-        Note: this can theoretically leave duplicate JiraIssues in various lists
-        Definition of "owns" in this context is: is assignee or reviewer of project
+        Adds an issue this member is already known to own, categorized by its open state and the member's role on it
         """
-        assert len(self.connection_names) > 0, 'add_if_owns on a member with no cached jira connection names'
+        if jira_issue.is_closed:
+            self._add_issue(self.REVIEWED if as_reviewer else self.CLOSED, jira_issue)
+        else:
+            self._add_issue(self.REVIEWER if as_reviewer else self.ASSIGNED, jira_issue)
 
-        if jira_connection.connection_name not in self.connection_names:
-            return False
+    @property
+    def owner_keys(self) -> List[Tuple[str, str]]:
+        """
+        :return: (jira connection name, user name) for the primary name and every alias of this member
+        """
+        return [(conn, user_name) for conn, user_names in self._lookup_order_by_conn.items() for user_name in user_names]
 
-        # We could optimize this by adding to the appropriate connection on determination of relationship with the
-        # JiraUserName, but we need to use the 'does this MemberIssuesByStatus object own this ticket' logic during
-        # ReportFilter detail processing as well. Consider optimization here later as needed.
-        owning_jira_name = self.get_owning_jira_user_name(jira_connection, jira_issue)
-        if owning_jira_name is None:
-            return False
+    @staticmethod
+    def build_owner_index(members: Iterable['MemberIssuesByStatus']) -> Dict[str, Dict[str, List['MemberIssuesByStatus']]]:
+        """
+        Maps jira connection name -> user name -> the members known by it, so ownership of an issue can be resolved
+        with a couple of dict probes rather than asking every member in turn. Members with no name on a connection are
+        absent from its map, so that connection's issues are never checked against them.
+        """
+        result = {}  # type: Dict[str, Dict[str, List[MemberIssuesByStatus]]]
+        for member in members:
+            for connection_name, user_name in member.owner_keys:
+                result.setdefault(connection_name, {}).setdefault(user_name, []).append(member)
+        return result
 
-        owning_name = owning_jira_name.user_name
-        if jira_issue.is_closed:
-            if jira_issue.is_reviewer(jira_connection, owning_name):
-                self.reviewed.append(jira_issue)
-            elif jira_issue.assignee == owning_name:
-                self.closed.append(jira_issue)
-        else:
-            if jira_issue.is_reviewer(jira_connection, owning_name):
-                self.reviewer.append(jira_issue)
-            elif jira_issue.assignee == owning_name:
-                self.assigned.append(jira_issue)
-            else:
-                print('LOGIC ERROR! owning_name: {} assignee: {} reviewer: {} reviewer2: {}'.format(owning_name, jira_issue.assignee, jira_issue.get_reviewer(jira_connection), jira_issue.get_value(jira_connection, 'reviewer2')))
-                raise Exception('owning_name is: {} but we did not match assignee nor reviewer on ticket: {}'.format(owning_name, jira_issue.issue_key))
-        return True
+    @staticmethod
+    def attach_to_owners(owner_index: Dict[str, Dict[str, List['MemberIssuesByStatus']]],
+                         jira_connection: JiraConnection,
+                         jira_issues: Iterable[JiraIssue]) -> int:
+        """
+        Attaches each of jira_issues to every member in owner_index that is its assignee or reviewer on jira_connection.
+        The first of a member's names on the connection, aliases before the primary name, that is the assignee or a
+        reviewer decides whether the member is treated as the reviewer.
+        :return: Count of (member, issue) attachments made
+        """
+        connection_name = jira_connection.connection_name
+        owners_by_name = owner_index.get(connection_name)
+        if not owners_by_name:
+            return 0
+
+        # Custom reviewer field names only vary per JiraProject, so translate them once per project rather than per issue
+        reviewer_fields = {}  # type: Dict[str, Tuple[str, str]]
+
+        count_added = 0
+        for jira_issue in jira_issues:
+            project_name = jira_issue.project_name
+            fields = reviewer_fields.get(project_name)
+            if fields is None:
+                jira_project = jira_issue.get_jira_project(jira_connection)
+                fields = (jira_project.translate_custom_field('reviewer'), jira_project.translate_custom_field('reviewer2'))
+                reviewer_fields[project_name] = fields
+
+            assignee = jira_issue.get('assignee')
+            reviewers = (jira_issue.get(fields[0]), jira_issue.get(fields[1]))
+
+            # Can't short-circuit since one member may be assignee and another reviewer. Dict keeps owners ordered.
+            owners = {}  # type: Dict[MemberIssuesByStatus, None]
+            for user_name in (assignee,) + reviewers:
+                if user_name is None:
+                    continue
+                for member in owners_by_name.get(user_name, ()):
+                    owners[member] = None
+
+            for member in owners:
+                for user_name in member._lookup_order_by_conn[connection_name]:
+                    if user_name in reviewers:
+                        member.attach(jira_issue, True)
+                        break
+                    if user_name == assignee:
+                        member.attach(jira_issue, False)
+                        break
+            count_added += len(owners)
+        return count_added
 
     @staticmethod
     def _debug_ticket(jira_issue, to_print: str) -> None:
@@ -187,43 +281,68 @@ class MemberIssuesByStatus:
         # TODO: Make this init from a flat config file, debug_issues.txt
         return False
 
-    def get_owning_jira_user_name(self, jira_connection: JiraConnection, jira_issue: JiraIssue) -> Optional[JiraUserName]:
-        """
-        Determines which, if any, of the JiraUserNames associated with this MemberIssuesByStatus worked on this JiraIssue
-        """
-        for jira_user_name in itertools.chain(list(self._aliased_names.values()), [self.primary_name]):
-            if jira_user_name.jira_connection_name != jira_connection.connection_name:
-                continue
-
-            user_name = jira_user_name.user_name
-            if jira_issue.assignee == user_name or jira_issue.is_reviewer(jira_connection, user_name):
-                return jira_user_name
-        if self.is_debug_jira_issue(jira_issue):
-            print('NO MATCH')
-        return None
-
     @classmethod
     def formatted_header(cls) -> str:
         return '{:40} {:15} {:15} {:15} {:15} {:15}'.format(
             'name(s)', 'assigned', 'reviewer', 'closed test', 'closed', 'reviewed')
 
     def formatted_summary(self) -> str:
-        return '{:40} {:<15} {:<15} {:<15} {:<15} {:<15}'.format(
-            str(sorted(self._aliased_names.keys()))[:40].ljust(40), len(self.assigned), len(self.reviewer),
-            self.closed_test_count(), len(self.closed),
-            len(self.reviewed))
+        names = str(self._sorted_alias_keys)[:40]
+        return f'{names:40} {len(self.assigned):<15} {len(self.reviewer):<15} ' \
+               f'{self.closed_test_count():<15} {len(self.closed):<15} {len(self.reviewed):<15}'
+
+    def _add_issue(self, status: int, jira_issue: JiraIssue) -> None:
+        self._issues.append(jira_issue)
+        self._status.append(status)
+        self._by_status.pop(status, None)
+
+    def issues_with_status(self, status: int) -> List[JiraIssue]:
+        """
+        Returns the issues this member owns with the given status code. Callers must not mutate the returned list.
+        """
+        result = self._by_status.get(status)
+        if result is None:
+            issues = self._issues
+            result = [issues[i] for i, code in enumerate(self._status) if code == status]
+            self._by_status[status] = result
+        return result
+
+    @property
+    def assigned(self) -> List[JiraIssue]:
+        return self.issues_with_status(self.ASSIGNED)
+
+    @property
+    def reviewer(self) -> List[JiraIssue]:
+        return self.issues_with_status(self.REVIEWER)
+
+    @property
+    def closed(self) -> List[JiraIssue]:
+        return self.issues_with_status(self.CLOSED)
+
+    @property
+    def reviewed(self) -> List[JiraIssue]:
+        return self.issues_with_status(self.REVIEWED)
 
     def sort_tickets(self) -> None:
-        self.assigned = JiraUtils.sort_jira_issues(self.assigned)
-        self.closed = JiraUtils.sort_jira_issues(self.closed)
-        self.reviewer = JiraUtils.sort_jira_issues(self.reviewer)
-        self.reviewed = JiraUtils.sort_jira_issues(self.reviewed)
+        """
+        Sorts both columns together, grouping by status and then by project name and issue number within each status
+        """
+        issues = self._issues
+        status = self._status
+
+        def sort_key(i: int) -> Tuple[int, str, int]:
+            project, _, number = issues[i].issue_key.partition('-')
+            return status[i], project, int(number)
+
+        order = sorted(range(len(issues)), key=sort_key)
+        self._issues = [issues[i] for i in order]
+        self._status = array('b', [status[i] for i in order])
+        self._by_status = {}
 
     def clear(self) -> None:
-        self.assigned = []
-        self.closed = []
-        self.reviewer = []
-        self.reviewed = []
+        self._issues = []
+        self._status = array('b')
+        self._by_status = {}
 
     @property
     def all_tickets(self) -> List[JiraIssue]:
@@ -240,62 +359,42 @@ class MemberIssuesByStatus:
         """
         print('[Detailed report for {}]'.format(self.primary_name))
 
-        df = DisplayFilter.team_details()
-
-        idx = 1
-        issues_displayed = []
-
-        # Use a scratch array so we don't print a summary for something we don't have details for
-        scratch = [x for x in self.assigned if report_filter.contains_issue(x)]
-        if len(scratch) > 0:
-            print('\n[ASSIGNED]')
-            sorted_issues = df.display_and_return_sorted_issues(jira_manager, scratch, idx)
-            idx += len(sorted_issues)
-            for jira_issue in sorted_issues:
-                issues_displayed.append(jira_issue)
-
-        scratch = [x for x in self.reviewer if report_filter.contains_issue(x)]
-        if len(scratch) > 0:
-            print('\n[REVIEWER]')
-            sorted_issues = df.display_and_return_sorted_issues(jira_manager, scratch, idx)
-            idx += len(sorted_issues)
-            for jira_issue in sorted_issues:
-                issues_displayed.append(jira_issue)
+        display = DisplayFilter.team_details().display_and_return_sorted_issues
+        contains = report_filter.contains_issue
 
         closed_test = []
         closed_non_test = []
-        for jira_issue in [x for x in self.closed if report_filter.contains_issue(x)]:
+        for jira_issue in self.closed:
+            if not contains(jira_issue):
+                continue
             # Note: designation of tickets as being 'test' related is via a label, not a component or issuetype
             if jira_issue.matches_label('test', False):
                 closed_test.append(jira_issue)
-                issues_displayed.append(jira_issue)
             else:
                 closed_non_test.append(jira_issue)
-                issues_displayed.append(jira_issue)
 
-        if len(closed_test) > 0:
-            print('\n[CLOSED TEST]')
-            printed = df.display_and_return_sorted_issues(jira_manager, closed_test, idx)
-            idx += len(printed)
+        # Use scratch arrays so we don't print a summary for something we don't have details for
+        sections = [
+            ('ASSIGNED', [x for x in self.assigned if contains(x)]),
+            ('REVIEWER', [x for x in self.reviewer if contains(x)]),
+            ('CLOSED TEST', closed_test),
+            ('CLOSED NON-TEST', closed_non_test),
+            ('REVIEWED', [x for x in self.reviewed if contains(x)])
+        ]
 
-        if len(closed_non_test) > 0:
-            print('\n[CLOSED NON-TEST]')
-            printed = df.display_and_return_sorted_issues(jira_manager, closed_non_test, idx)
-            idx += len(printed)
-
-        scratch = [x for x in self.reviewed if report_filter.contains_issue(x)]
-        if len(scratch) > 0:
-            print('\n[REVIEWED]')
-            printed = df.display_and_return_sorted_issues(jira_manager, scratch, idx)
+        idx = 1
+        issues_displayed = []  # type: List[JiraIssue]
+        for section_name, scratch in sections:
+            if len(scratch) == 0:
+                continue
+            print('\n[{}]'.format(section_name))
+            printed = display(jira_manager, scratch, idx)
             idx += len(printed)
-            for jira_issue in printed:
-                issues_displayed.append(jira_issue)
+            issues_displayed.extend(printed)
 
         return issues_displayed
 
     def __str__(self) -> str:
-        return 'primary name: {} known aliases: {} assigned: {} reviewer: {} closed test: {} closed: {} reviewed: {}'.format(
-            self.primary_name,
-            sorted(self._aliased_names.keys()),
-            len(self.assigned), len(self.reviewer), self.closed_test_count(),
-            len(self.closed), len(self.reviewed))
+        return f'primary name: {self.primary_name} known aliases: {self._sorted_alias_keys} ' \
+               f'assigned: {len(self.assigned)} reviewer: {len(self.reviewer)} closed test: {self.closed_test_count()} ' \
+               f'closed: {len(self.closed)} reviewed: {len(self.reviewed)}'
@@ -20,6 +20,10 @@ class MenuOption:
     Contains a string representing a member and a method delegate to call on invocation
     """
 
+    # Stateless options are shared across every menu render rather than re-allocated each time
+    _blank_line = None  # type: Optional[MenuOption]
+    _quit_program = None  # type: Optional[MenuOption]
+
     def __init__(self, hotkey: Optional[str], name: Optional[str], method: Optional[Callable], pause: bool = True) -> None:
         """
         :param hotkey: The key that the user will use to select this option.
@@ -35,14 +39,18 @@ class MenuOption:
         self.entry_method = method  # type: Optional[Callable]
         self.needs_pause = pause
 
-    @staticmethod
-    def print_blank_line() -> 'MenuOption':
-        return MenuOption(None, None, None)
+    @classmethod
+    def print_blank_line(cls) -> 'MenuOption':
+        if cls._blank_line is None:
+            cls._blank_line = cls(None, None, None)
+        return cls._blank_line
 
     @staticmethod
     def return_to_previous_menu(previous_menu_call: Callable) -> 'MenuOption':
         return MenuOption('q', 'Return to previous menu', previous_menu_call, pause=False)
 
-    @staticmethod
-    def quit_program() -> 'MenuOption':
-        return MenuOption('q', 'Quit', exit)
+    @classmethod
+    def quit_program(cls) -> 'MenuOption':
+        if cls._quit_program is None:
+            cls._quit_program = cls('q', 'Quit', exit)
+        return cls._quit_program
@@ -13,7 +13,9 @@
 # limitations under the License.
 
 import os
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
+import sys
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
 from src import utils
 from src.member_issues_by_status import JiraUserName, MemberIssuesByStatus
@@ -23,6 +25,9 @@ if TYPE_CHECKING:
     from src.jira_connection import JiraConnection
     from src.jira_issue import JiraIssue
 
+# Sort key for members in report order. attrgetter resolves the attribute chain in C rather than through a lambda.
+_MEMBER_NAME_KEY = attrgetter('primary_name.user_name')
+
 
 class Team:
     """
@@ -31,21 +36,80 @@ class Team:
     """
 
     def __init__(self, name: str, jira_connection_name: str) -> None:
-        self.name = name
+        # Interned to share storage with the team and connection names held by every member's JiraUserName
+        self.name = sys.intern(name)
 
         # Only used for identification during serialization
-        self.jira_connection_name = jira_connection_name
+        self.jira_connection_name = sys.intern(jira_connection_name)
+
+        # Both parts are fixed for the life of the team, so the serialized root name is built once
+        self._root_name = f'{self.name}:{self.jira_connection_name}'
 
         # Dict of [JiraUserName:MemberIssuesByStatus]. We key this by the first JiraConnection username the user is added with, though
         # it should be relatively agnostic.
         self._team_members = {}  # type: Dict[JiraUserName, MemberIssuesByStatus]
 
+        # Secondary index of user name to the JiraUserName keys above, in insertion order. Kept in sync with
+        # _team_members so name lookups don't need to scan every member.
+        self._name_index = {}  # type: Dict[str, List[JiraUserName]]
+
+        # Built on first read and dropped whenever membership changes
+        self._members_cache = None  # type: Optional[List[MemberIssuesByStatus]]
+        self._member_names_cache = None  # type: Optional[List[str]]
+        self._sorted_members_cache = None  # type: Optional[List[MemberIssuesByStatus]]
+
+        # (root name, options) config sections for members not yet constructed. See add_member_section.
+        self._pending_member_sections = []  # type: List[Tuple[str, Dict[str, str]]]
+
+    def add_member_section(self, root_name: str, options: Dict[str, str]) -> None:
+        """
+        Queues a member's teams.cfg section. The MemberIssuesByStatus is only built once this team's membership is
+        first read or changed, so teams that are never used in a session cost no member construction.
+        """
+        self._pending_member_sections.append((root_name, options))
+
+    def _hydrate(self) -> None:
+        if not self._pending_member_sections:
+            return
+        # Cleared first as add_existing_member re-enters here
+        pending = self._pending_member_sections
+        self._pending_member_sections = []
+        for root_name, options in pending:
+            self.add_existing_member(MemberIssuesByStatus.from_file(root_name, options))
+
     def add_member(self, name: str, jira_connection: 'JiraConnection') -> None:
         new_key = JiraUserName(name, jira_connection.connection_name, self.name)
-        self._team_members[new_key] = MemberIssuesByStatus(new_key)
+        self._add_member_issues(new_key, MemberIssuesByStatus(new_key))
 
     def add_existing_member(self, member_issues: MemberIssuesByStatus) -> None:
-        self._team_members[member_issues.primary_name] = member_issues
+        self._add_member_issues(member_issues.primary_name, member_issues)
+
+    def _add_member_issues(self, key: JiraUserName, member_issues: MemberIssuesByStatus) -> None:
+        self._hydrate()
+        if key not in self._team_members:
+            self._name_index.setdefault(key.user_name, []).append(key)
+        self._team_members[key] = member_issues
+        self._invalidate_member_caches()
+
+    def _remove_member_issues(self, key: JiraUserName) -> None:
+        del self._team_members[key]
+        keys = self._name_index[key.user_name]
+        keys.remove(key)
+        if len(keys) == 0:
+            del self._name_index[key.user_name]
+        self._invalidate_member_caches()
+
+    def _invalidate_member_caches(self) -> None:
+        self._members_cache = None
+        self._member_names_cache = None
+        self._sorted_members_cache = None
+
+    def has_member(self, user_name: str) -> bool:
+        """
+        Constant time membership check by user name. Prefer this over scanning member_names.
+        """
+        self._hydrate()
+        return user_name in self._name_index
 
     def prompt_to_remove_member(self) -> bool:
         """
@@ -57,41 +121,65 @@ class Team:
         to_del = self.convert_name_to_jira_user_name(to_remove)
         if to_del is None:
             return False
-        del self._team_members[to_del]
+        self._remove_member_issues(to_del)
         return True
 
     def delete_member(self, user_name: str) -> None:
-        to_delete = None
-        for jun in self._team_members.keys():
-            if jun.user_name == user_name:
-                to_delete = jun
-        if to_delete is not None:
-            del self._team_members[to_delete]
+        """
+        Removes the most recently added member with this user name, if any. Resolved through the name index, so there is
+        no scan over _team_members.
+        """
+        self._hydrate()
+        keys = self._name_index.get(user_name)
+        if keys:
+            self._remove_member_issues(keys[-1])
 
     @property
     def root_name(self) -> str:
-        return '{}:{}'.format(self.name, self.jira_connection_name)
+        return self._root_name
 
     @property
     def member_names(self) -> List[str]:
-        return [x.user_name for x in self._team_members.keys()]
+        """
+        Cached; callers must not mutate the returned list.
+        """
+        self._hydrate()
+        if self._member_names_cache is None:
+            self._member_names_cache = [x.user_name for x in self._team_members.keys()]
+        return self._member_names_cache
 
     @property
     def members(self) -> List[MemberIssuesByStatus]:
-        return list(self._team_members.values())
+        """
+        Cached; callers must not mutate the returned list.
+        """
+        self._hydrate()
+        if self._members_cache is None:
+            self._members_cache = list(self._team_members.values())
+        return self._members_cache
+
+    @property
+    def sorted_members(self) -> List[MemberIssuesByStatus]:
+        """
+        Members ordered by primary user name, as displayed in reports. Cached; callers must not mutate the returned list.
+        """
+        self._hydrate()
+        if self._sorted_members_cache is None:
+            self._sorted_members_cache = sorted(self._team_members.values(), key=_MEMBER_NAME_KEY)
+        return self._sorted_members_cache
 
     def convert_name_to_jira_user_name(self, name: str) -> Optional[JiraUserName]:
         """
         If we have a unique JiraUserName, we'll translate name to that. Throws on duplicates found, so use with caution.
         """
-        found = None
-        for jun in self._team_members:
-            if jun.user_name == name:
-                # TODO: Given it's reasonable for someone to re-use jira usernames across projects, we should support this.
-                if found is not None:
-                    raise Exception('Found duplicate user name in get_member_by_name: {}'.format(name))
-                found = jun
-        return found
+        self._hydrate()
+        keys = self._name_index.get(name)
+        if not keys:
+            return None
+        # TODO: Given it's reasonable for someone to re-use jira usernames across projects, we should support this.
+        if len(keys) > 1:
+            raise Exception(f'Found duplicate user name in get_member_by_name: {name}')
+        return keys[0]
 
     def get_member_issues(self, name: str) -> Optional[MemberIssuesByStatus]:
         """
@@ -109,29 +197,32 @@ class Team:
         """
         :return: Set of all jira connections that team members on this team have a relationship with.
         """
+        self._hydrate()
         result = set()
-        for member in list(self._team_members.values()):
+        for member in self._team_members.values():
             result.update(member.connection_names)
         return result
 
     def populate_jira_issues(self, jira_connection: 'JiraConnection', issues: List[List['JiraIssue']]) -> None:
+        self._hydrate()
         count_added = 0
+        owner_index = MemberIssuesByStatus.build_owner_index(self._team_members.values())
         for list_of_issues in issues:
-            for jira_issue in list_of_issues:
-                for member in list(self._team_members.values()):
-                    # Can't short-circuit here since one member may be assignee and another reviewer
-                    if member.add_if_owns(jira_connection, jira_issue):
-                        count_added += 1
-        utils.argus_debug('Team: {}. JiraConnection: {}. Count added: {}'.format(self.name, jira_connection.connection_name, count_added))
-        for member in list(self._team_members.values()):
-            utils.argus_debug('At end of add_owned_issues for team: {}. Member: {}'.format(self.name, member))
+            count_added += MemberIssuesByStatus.attach_to_owners(owner_index, jira_connection, list_of_issues)
+        # Formatting a member walks all of its issues, so skip the work entirely unless debugging
+        if utils.debug:
+            utils.argus_debug('Team: {}. JiraConnection: {}. Count added: {}'.format(self.name, jira_connection.connection_name, count_added))
+            for member in self._team_members.values():
+                utils.argus_debug('At end of add_owned_issues for team: {}. Member: {}'.format(self.name, member))
 
     def clear_jira_issues(self) -> None:
-        for member in list(self._team_members.values()):
+        self._hydrate()
+        for member in self._team_members.values():
             member.clear()
 
     def __str__(self) -> str:
-        result = '{}:'.format(self.name)
-        for member in sorted([x.primary_user_name for x in list(self._team_members.values())]):
-            result += os.linesep + '   {}'.format(member)
+        self._hydrate()
+        result = f'{self.name}:'
+        for member in sorted([x.primary_user_name for x in self._team_members.values()]):
+            result += f'{os.linesep}   {member}'
         return result
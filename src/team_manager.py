@@ -13,26 +13,43 @@
 # limitations under the License.
 
 import configparser
+import hashlib
+import io
 import os
 import sys
 import traceback
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Set, TextIO
 
 from jira import JIRAError
 
-from src import time_utils
+from src import time_utils, utils
+from src.jira_connection import JiraConnection
 from src.jira_utils import JiraUtils
 from src.member_issues_by_status import JiraUserName, MemberIssuesByStatus
 from src.team import Team
 from src.team_reports import (ReportCurrentLoad, ReportFilter, ReportFixVersion, ReportMeta, ReportMomentum,
                               ReportReviewLoad, ReportTestLoad, ReportType)
 from src.utils import (as_int, clear, conf_dir, get_input, is_yes, pause, pick_value,
-                       print_separator, save_argus_config, argus_debug)
+                       print_separator, write_argus_config, argus_debug)
 
 if TYPE_CHECKING:
     from src.jira_manager import JiraManager
 
 
+# Report selection menu shared by team and org reports. Built once as the ReportType values are constants.
+_REPORT_MENU = '\n'.join([
+    '{}: Run a momentum report: closed tickets, closed test tickets, closed reviews for a custom time frame'.format(ReportType.MOMENTUM),
+    '{}: Team load report: assigned bugs, assigned tests, assigned features, assigned reviews, patch available reviews'.format(ReportType.CURRENT_LOAD),
+    '{}: Test load report: snapshot of currently assigned tests and closed tests in a custom time frame'.format(ReportType.TEST_LOAD),
+    '{}: Review load report: snapshot of currently assigned reviews, Patch Available reviews, and finished reviews in a custom time frame'.format(ReportType.REVIEW_LOAD),
+    '{}: FixVersion report: show data for all tickets on a fixversion over time frame'.format(ReportType.FIXVERSION),
+    '{}: Meta report: show data for meta workload for a team'.format(ReportType.META)
+])
+
+# Equivalent of print_separator(30), opening each team's block in org reports
+_TEAM_SEPARATOR = '-' * 30 + os.linesep
+
+
 class TeamManager:
 
     """
@@ -53,6 +70,12 @@ class TeamManager:
         self._teams = {}  # type: Dict[str, Team]
         self._organizations = {}  # type: Dict[str, Set[str]]
 
+        # Set by multi-step edits that defer writing teams.cfg until the user leaves the menu. See _save_if_dirty.
+        self._dirty = False
+
+        # sha256 of the teams.cfg content last loaded or written, so unchanged configs aren't rewritten
+        self._last_saved_hash = None  # type: Optional[str]
+
     def prompt_for_team_addition(self, jira_manager: 'JiraManager') -> None:
         name = get_input('Name this new team:', lowered=False)
 
@@ -60,6 +83,8 @@ class TeamManager:
         if jira_connection_name is None:
             return
         self._teams[name] = Team(name, jira_connection_name)
+        # Persist the new team even if no members are added to it in edit_team
+        self._dirty = True
         self.edit_team(jira_manager, name)
 
     def add_existing_team(self, new_team: Team) -> None:
@@ -67,19 +92,15 @@ class TeamManager:
 
     def add_organization(self) -> None:
         while True:
-            if len(self._organizations.keys()) != 0:
-                print('Known organizations:')
-            for known_org in self._organizations.keys():
-                print('   {}'.format(known_org))
+            if len(self._organizations) != 0:
+                print('\n'.join(['Known organizations:'] + ['   {}'.format(known_org) for known_org in self._organizations]))
             org_name = get_input('Enter a new org name, [q] to quit:', False)
             if org_name == 'q':
                 break
             new_org = set()  # type: Set[str]
             while True:
                 clear()
-                print('Org: {}'.format(org_name))
-                for team_name in new_org:
-                    print('   {}'.format(team_name))
+                print('\n'.join(['Org: {}'.format(org_name)] + ['   {}'.format(team_name) for team_name in new_org]))
                 choice = get_input('[a]dd a new team to this org, [q]uit')
                 if choice == 'q':
                     break
@@ -97,7 +118,7 @@ class TeamManager:
                 break
 
     def remove_organization(self) -> None:
-        selection = pick_value('Remove which organization?', list(self._organizations.keys()))
+        selection = pick_value('Remove which organization?', self._organizations.keys())
         if selection is None:
             return
         del self._organizations[selection]
@@ -105,16 +126,15 @@ class TeamManager:
 
     def list_teams(self) -> None:
         print_separator(40)
-        print('Currently defined teams:')
-        for team in list(self._teams.values()):
-            print('{}'.format(team))
+        print('\n'.join(['Currently defined teams:'] + [str(team) for team in self._teams.values()]))
         print_separator(40)
 
     def pick_team(self, skip_list: Optional[List[str]] = None) -> Optional[Team]:
         if skip_list is None:
-            valid_names = list(self._teams.keys())
+            valid_names = self._teams.keys()  # type: Iterable[str]
         else:
-            valid_names = [x for x in self._teams.keys() if x not in skip_list]
+            skip_set = set(skip_list)
+            valid_names = [x for x in self._teams if x not in skip_set]
         team_name = pick_value('Select a team', valid_names, True, 'Cancel')
         if team_name is None:
             return None
@@ -125,12 +145,13 @@ class TeamManager:
 
     def edit_team(self, jira_manager: 'JiraManager', team_name: str = None) -> None:
         if team_name is None:
-            team_name = pick_value('Edit which team?', list(self._teams.keys()), True, 'Cancel')
+            team_name = pick_value('Edit which team?', self._teams.keys(), True, 'Cancel')
             if team_name is None:
                 return None
 
         team = self._teams[team_name]
         jira_connection = jira_manager.get_jira_connection(team.jira_connection_name)
+        pick_assignees = jira_connection.pick_assignees
 
         while True:
             clear()
@@ -139,18 +160,19 @@ class TeamManager:
             print('-------------------------')
             cmd = get_input('[A]dd more members, [R]emove a member, or [Q]uit?')
             if cmd == 'a':
-                assignees = jira_connection.pick_assignees(sys.maxsize)
+                assignees = pick_assignees(sys.maxsize)
                 if assignees is None or len(assignees) == 0:
                     print('No assignees chosen. Returning.')
-                    return None
+                    break
+                # Config is saved once on exit from this menu, and only if membership changed, rather than per added member
                 for assignee in assignees:
-                    if assignee in team.member_names:
+                    if team.has_member(assignee):
                         print('Assignee already exists in {}. Skipping.'.format(team.name))
                         continue
                     else:
                         team.add_member(assignee, jira_connection)
+                        self._dirty = True
                         print('Added {} to {}.'.format(assignee, team.name))
-                        self._save_config()
             elif cmd == 'r':
                 to_delete = pick_value('Remove which assignee?', team.member_names, True, 'Cancel')
                 if to_delete is None:
@@ -158,12 +180,13 @@ class TeamManager:
                 confirm = get_input('Delete {} from {}: Are you sure?'.format(to_delete, team.name))
                 if confirm == 'y':
                     team.delete_member(to_delete)
+                    self._dirty = True
             elif cmd == 'q':
                 break
             else:
                 print('Bad input. Valid input: A, R, or Q.')
                 pause()
-        self._save_config()
+        self._save_if_dirty()
 
     def remove_team(self) -> Optional[str]:
         """
@@ -172,7 +195,7 @@ class TeamManager:
         if len(self._teams) == 0:
             print('No teams currently defined.')
             return None
-        to_remove = pick_value('Remove which team?', list(self._teams.keys()), True, 'Cancel')
+        to_remove = pick_value('Remove which team?', self._teams.keys(), True, 'Cancel')
         if to_remove is None:
             return None
         if is_yes('Are you sure you want to delete {}?'.format(to_remove)):
@@ -189,10 +212,7 @@ class TeamManager:
             print('Must first add a team before adding a linked member.')
             return
 
-        count = 0
-        for team in list(self._teams.values()):
-            count += len(team.members)
-        if count == 0:
+        if not any(team.members for team in self._teams.values()):
             print('No members found on any teams. Add members before attempting to link members.')
             return
 
@@ -201,7 +221,6 @@ class TeamManager:
         if target_member is None:
             return
 
-        changed = False
         while True:
             print('Current state of user: {}'.format(target_member))
             jira_connection_to_alias = jira_manager.pick_jira_connection('Alias to a user account on which JIRA connection?')
@@ -215,18 +234,17 @@ class TeamManager:
 
             new_user_alias = JiraUserName(user_to_alias_to, jira_connection_to_alias.connection_name, 'alias')
             target_member.add_alias(new_user_alias)
-            changed = True
+            self._dirty = True
 
             if not is_yes('Add another alias?'):
                 break
-        if changed:
-            self._save_config()
+        self._save_if_dirty()
 
     def _pick_member_for_linkage_operation(self, action: str) -> Optional[MemberIssuesByStatus]:
         """
         Prompts for both team to remove from and then member. Used on both addition and deletion paths.
         """
-        target_team_name = pick_value('{} a linked member on which team?'.format(action), list(self._teams.keys()))
+        target_team_name = pick_value('{} a linked member on which team?'.format(action), self._teams.keys())
         if target_team_name is None:
             return None
         target_team = self._teams[target_team_name]
@@ -251,136 +269,140 @@ class TeamManager:
         """
         Sub-menu driven method to run a specific type of report across multiple teams within an organization
         """
-        org_name = None
-
         if len(self._organizations) == 0:
             # We don't prompt for addition now since we'd have to pass in main menu context to do that from here.
             print('No organizations found. Please use the Team Management menu to define a new organization before running a report.')
             pause()
             return
 
-        while True:
-            clear()
-            if org_name is None:
-                print_separator(40)
-                org_name = pick_value('Run reports against which organization?', list(self._organizations.keys()))
-                # None return from pick_team == cancel
-                if org_name is None:
-                    return
-                for team_name in sorted(self._organizations[org_name]):
-                    active_team = self._teams[team_name]
-                    print('Populating tickets for team: {}'.format(active_team.name))
-                    TeamManager.populate_owned_jira_issues(jira_manager, active_team.members)
-
-            print('---------------------')
-            print('-    Org Menu      -')
-            print('---------------------')
-            print('t: Change active org. Current: {}'.format(org_name))
-            self._print_report_menu()
-            print('q: Cancel')
-            print('---------------------')
-            choice = get_input(':')
-            if choice == 'q':
-                return
-            elif choice == 't':
-                org_name = None
-            try:
-                report_type = ReportType.from_int(int(choice))
-                if report_type == ReportType.UNKNOWN:
-                    print('Bad input: {}. Try again.'.format(choice))
-                    pause()
-                else:
-                    report_to_run = TeamManager.reports[report_type]
-                    if TeamManager.reports[report_type].needs_duration:
-                        report_to_run.since = time_utils.since_now(ReportFilter.get_since())
-                    # making mypy happy
-                    assert org_name is not None
-                    self._run_org_report(jira_manager, org_name, report_to_run)
-                    pause()
-            except (ValueError, TypeError) as e:
-                print('Error on input: {}. Try again'.format(e))
-                traceback.print_exc()
-                pause()
+        # Teams are populated when a report first needs them rather than on org selection, and only once per session
+        # as the cached issues they're populated from don't change while in this menu.
+        populated = set()  # type: Set[str]
+
+        def select_org() -> Optional[str]:
+            print_separator(40)
+            # None return from pick_team == cancel
+            return pick_value('Run reports against which organization?', self._organizations.keys())
+
+        def run_report(org_name: str, report_filter: ReportFilter) -> None:
+            for team_name in sorted(self._organizations[org_name]):
+                if team_name in populated:
+                    continue
+                active_team = self._teams[team_name]
+                print('Populating tickets for team: {}'.format(active_team.name))
+                TeamManager.populate_owned_jira_issues(jira_manager, active_team.members)
+                populated.add(team_name)
+
+            if report_filter.needs_duration:
+                report_filter.since = time_utils.since_now(ReportFilter.get_since())
+            self._run_org_report(jira_manager, org_name, report_filter)
+            pause()
+
+        self._report_menu_loop('Org', 'org', select_org, run_report)
 
     def run_team_reports(self, jira_manager: 'JiraManager') -> None:
         """
         Sub-menu driven method to run some specific reports of interest against teams. This will take into account
         linked members and run the report for all tickets across multiple JIRA connections.
         """
-        selected_team = None
-
         if len(self._teams) == 0:
             # We don't prompt for addition now since we'd have to pass in main menu context to do that from here.
             print('No teams found. Please use the Team Management menu to define a new team before running a report.')
             pause()
             return
 
+        def select_team() -> Optional[str]:
+            print('No active team. Please select a team:')
+            selected_team = self.pick_team()
+            # None return from pick_team == cancel
+            if selected_team is None:
+                return None
+            TeamManager.populate_owned_jira_issues(jira_manager, selected_team.members)
+            return selected_team.name
+
+        def run_report(team_name: str, report_filter: ReportFilter) -> None:
+            TeamManager._run_report(jira_manager, self._teams[team_name], report_filter)
+
+        self._report_menu_loop('Team', 'root team', select_team, run_report)
+
+    @staticmethod
+    def _report_menu_loop(menu_name: str,
+                          target_label: str,
+                          select_target: Callable[[], Optional[str]],
+                          run_report: Callable[[str, ReportFilter], None]) -> None:
+        """
+        Menu skeleton shared by team and org reports: keeps an active target (team or org name), re-selecting it via
+        select_target on 't', and hands the chosen report to run_report until the user quits.
+        :param select_target: Prompts for and populates a target. Returns its name, or None on cancel
+        """
+        target = None  # type: Optional[str]
         while True:
             clear()
-            if selected_team is None:
-                print('No active team. Please select a team:')
-                selected_team = self.pick_team()
-                # None return from pick_team == cancel
-                if selected_team is None:
+            if target is None:
+                target = select_target()
+                if target is None:
                     return
-                TeamManager.populate_owned_jira_issues(jira_manager, selected_team.members)
-
-            print('---------------------')
-            print('-    Team Menu      -')
-            print('---------------------')
-            print('t: Change active root team. Current: {}'.format(selected_team.name))
-            self._print_report_menu()
-            print('q: Cancel')
-            print('---------------------')
+
+            print('\n'.join(['---------------------',
+                             '-    {} Menu      -'.format(menu_name),
+                             '---------------------',
+                             't: Change active {}. Current: {}'.format(target_label, target)]))
+            TeamManager._print_report_menu()
+            print('q: Cancel\n---------------------')
             choice = get_input(':')
             if choice == 'q':
                 return
             elif choice == 't':
-                selected_team = None
+                target = None
+                continue
+
+            report_type = ReportType.from_int(int(choice)) if choice.isdigit() else ReportType.UNKNOWN
+            if report_type == ReportType.UNKNOWN:
+                print('Bad input: {}. Try again.'.format(choice))
+                pause()
+                continue
             try:
-                report_type = ReportType.from_int(int(choice))
-                if report_type == ReportType.UNKNOWN:
-                    print('Bad input: {}. Try again.'.format(choice))
-                    pause()
-                else:
-                    assert selected_team is not None
-                    TeamManager._run_report(jira_manager, selected_team, TeamManager.reports[report_type])
+                run_report(target, TeamManager.reports[report_type])
             except (ValueError, TypeError) as e:
                 print('Error on input: {}. Try again'.format(e))
-                traceback.print_exc()
+                # Stack walk and formatting only when debugging; the message above is enough for interactive use
+                if utils.debug:
+                    traceback.print_exc()
                 pause()
 
     @staticmethod
     def _print_report_menu() -> None:
-        print('{}: Run a momentum report: closed tickets, closed test tickets, closed reviews for a custom time frame'.format(ReportType.MOMENTUM))
-        print('{}: Team load report: assigned bugs, assigned tests, assigned features, assigned reviews, patch available reviews'.format(ReportType.CURRENT_LOAD))
-        print('{}: Test load report: snapshot of currently assigned tests and closed tests in a custom time frame'.format(ReportType.TEST_LOAD))
-        print('{}: Review load report: snapshot of currently assigned reviews, Patch Available reviews, and finished reviews in a custom time frame'.format(ReportType.REVIEW_LOAD))
-        print('{}: FixVersion report: show data for all tickets on a fixversion over time frame'.format(ReportType.FIXVERSION))
-        print('{}: Meta report: show data for meta workload for a team'.format(ReportType.META))
+        # Prebuilt, so the whole menu goes out in a single write
+        print(_REPORT_MENU)
 
     @staticmethod
     def populate_owned_jira_issues(jira_manager: 'JiraManager', team_members: List[MemberIssuesByStatus]) -> None:
-        related_jira_connections = set()
-        # clear out any cached data on this team and build a set of JiraConnections we want to add tickets from
+        if not team_members:
+            return
+
+        # clear out any cached data on this team
         for member in team_members:
             member.clear()
-            related_jira_connections.update(member.connection_names)
+
+        # On each connection that this team is related to, we add all owned issues to this team member
+        # For every JiraIssue per JiraProject per JiraConnection, look up the members that are "owners" by assignee
+        # and reviewer name and link the JiraIssue to that MemberIssuesByStatus. The index is keyed by connection name,
+        # so its keys are exactly the JiraConnections we want to add tickets from.
+        owner_index = MemberIssuesByStatus.build_owner_index(team_members)
+
+        # Members are cleared above; with no connections there is nothing to add or sort
+        if not owner_index:
+            return
 
         count_added = 0
         print('Adding tickets to members. Please wait...')
-        # On each connection that this team is related to, we add all owned issues to this team member
-        # For every JiraIssue per JiraProject per JiraConnection, find all the members that are "owners' and link the
-        # JiraIssue to that MemberIssuesByStatus
-        for jira_connection_name in related_jira_connections:
-            jira_connection = jira_manager.get_jira_connection(jira_connection_name)
-            cached_issue_lists = jira_connection.cached_jira_issues
-            for list_of_issues in cached_issue_lists:
-                for jira_issue in list_of_issues:
-                    for member in team_members:
-                        # Can't short-circuit here since one member may be assignee and another reviewer
-                        if member.add_if_owns(jira_connection, jira_issue):
-                            count_added += 1
+        for connection_name in owner_index:
+            jira_connection = jira_manager.get_jira_connection(connection_name)
+            for list_of_issues in jira_connection.cached_jira_issues:
+                count_added += MemberIssuesByStatus.attach_to_owners(owner_index, jira_connection, list_of_issues)
+
+        if count_added == 0:
+            return
 
         print('Sorting tickets by key. Please wait...')
         for member in team_members:
@@ -401,21 +423,23 @@ class TeamManager:
             count = 1
             # Store displayed order at top level, sorted on per-team basis
             meta_sorted_issues = []
+            # Same for every team in this pass
+            column_headers = report_filter.column_headers()
             for team_name in self._organizations[org_name]:
-                print_separator(30)
-                print('[Team: {}]'.format(team_name))
-                print(report_filter.column_headers())
-                team_members = self._teams[team_name].members
-                sorted_members = sorted(team_members, key=lambda s: s.primary_name.user_name)
+                print('{}\n[Team: {}]\n{}'.format(_TEAM_SEPARATOR, team_name, column_headers))
+                sorted_members = self._teams[team_name].sorted_members
                 meta_sorted_issues.extend(sorted_members)
 
-                # Display in sorted order per team.
+                # Display in sorted order per team. Rows are buffered and written in one go.
+                rows = []
                 for member_issues in sorted_members:
                     report_filter.clear()
                     # We perform pre-processing and one-off prompting for time duration in .process call
                     report_filter.process_issues(member_issues)
-                    print('{:5}: {}'.format(count, report_filter.print_all_counts(member_issues.primary_name.user_name)))
+                    rows.append('{:5}: {}'.format(count, report_filter.print_all_counts(member_issues.primary_name.user_name)))
                     count += 1
+                if rows:
+                    print('\n'.join(rows))
 
             selection = get_input('[#] to open details for a team member, [q] to return to previous menu')
             if selection == 'q':
@@ -426,7 +450,7 @@ class TeamManager:
 
             # 0 indexed on List
             int_sel -= 1
-            if int_sel > len(meta_sorted_issues) or int_sel < 0:
+            if int_sel >= len(meta_sorted_issues) or int_sel < 0:
                 print('Bad value.')
                 continue
             tickets = meta_sorted_issues[int_sel]
@@ -441,7 +465,7 @@ class TeamManager:
         report_filter.prompt_for_data()
 
         try:
-            sorted_member_issues = sorted(team.members, key=lambda s: s.primary_name.user_name)
+            sorted_member_issues = team.sorted_members
 
             while True:
                 # Print out a menu of the meta information for each team member
@@ -453,12 +477,15 @@ class TeamManager:
 
                 count = 1
 
+                rows = []
                 for member_issues in sorted_member_issues:
                     report_filter.clear()
                     # We perform pre-processing and one-off prompting for time duration in .process call
                     report_filter.process_issues(member_issues)
-                    print('{:5}: {}'.format(count, report_filter.print_all_counts(member_issues.primary_name.user_name)))
+                    rows.append('{:5}: {}'.format(count, report_filter.print_all_counts(member_issues.primary_name.user_name)))
                     count += 1
+                if rows:
+                    print('\n'.join(rows))
 
                 print_separator(40)
                 cmd = get_input('[#] Integer value to see a detailed breakdown by category. [q] to return to menu:')
@@ -469,7 +496,7 @@ class TeamManager:
                     break
 
                 selection -= 1
-                if selection < 0 or selection > len(sorted_member_issues):
+                if selection < 0 or selection >= len(sorted_member_issues):
                     print('Bad Selection.')
                     continue
                 full_member_issues = sorted_member_issues[selection]
@@ -484,6 +511,8 @@ class TeamManager:
         report_filter.clear()
         report_filter.process_issues(tickets)
         displayed_issues = tickets.display_member_issues(jira_manager, report_filter)
+        # Connections resolved while browsing this member's issues, keyed by connection name
+        jira_connections = {}  # type: Dict[str, JiraConnection]
 
         while True:
             if len(displayed_issues) == 0:
@@ -495,7 +524,10 @@ class TeamManager:
                 break
             try:
                 jira_issue = displayed_issues[int(cmd) - 1]
-                jira_connection = jira_manager.get_jira_connection(jira_issue.jira_connection_name)
+                jira_connection = jira_connections.get(jira_issue.jira_connection_name)
+                if jira_connection is None:
+                    jira_connection = jira_manager.get_jira_connection(jira_issue.jira_connection_name)
+                    jira_connections[jira_issue.jira_connection_name] = jira_connection
                 JiraUtils.open_issue_in_browser(jira_connection.url, jira_issue.issue_key)
             except ValueError as ve:
                 print('Bad input. Try again.')
@@ -505,19 +537,23 @@ class TeamManager:
     @classmethod
     def from_file(cls) -> 'TeamManager':
         print('Loading Team config from file')
-        config_parser = configparser.RawConfigParser()
+        config_path = os.path.join(conf_dir, 'teams.cfg')
         try:
             result = TeamManager()
 
-            if not os.path.exists(os.path.join(conf_dir, 'teams.cfg')):
+            if not os.path.exists(config_path):
                 argus_debug('Did not find any existing conf/teams.cfg file. Empty TeamManager.')
                 return result
 
-            config_parser.read(os.path.join(conf_dir, 'teams.cfg'))
+            # Read once, both to parse and to hash for the unchanged-save check
+            with open(config_path, 'r', buffering=1 << 16) as config_file:
+                content = config_file.read()
+            sections = TeamManager._read_config_sections(content)
+            result._last_saved_hash = TeamManager._hash_config(content)
 
             # Add teams
-            if config_parser.has_section('manager'):
-                team_roots = config_parser.get('manager', 'team_names').split(',')
+            if 'manager' in sections:
+                team_roots = sections['manager']['team_names'].split(',')
                 for team_root in team_roots:
                     # Skip trailing ,
                     if team_root == '':
@@ -526,55 +562,119 @@ class TeamManager:
                     result._teams[name] = Team(name, jira_connection_name)
                     argus_debug('TeamManager.init: Adding team: {} from config'.format(name))
 
-            # Add MemberIssuesByStatus
-            for member_root_name in config_parser.sections():
+            # Hand MemberIssuesByStatus sections to their teams, which only construct the members on first use
+            for member_root_name, options in sections.items():
                 # TODO: Consider removing these two manualy bypasses. Kind of hacky to assume everything in config is member root.
                 if member_root_name == 'manager' or member_root_name == 'organizations':
                     continue
-                new_member = MemberIssuesByStatus.from_file(member_root_name, config_parser)
-                team = result.get_team_by_name(new_member.primary_team)
+                team_name = JiraUserName.from_combined_string(member_root_name).team_name
+                team = result.get_team_by_name(team_name)
                 if team is None:
-                    raise ValueError('Failed to find a constructed team with name: {}'.format(new_member.primary_team))
-                team.add_existing_member(new_member)
-                argus_debug('TeamManager init: Adding team member: {}'.format(new_member.full_name))
+                    raise ValueError('Failed to find a constructed team with name: {}'.format(team_name))
+                team.add_member_section(member_root_name, options)
+                argus_debug('TeamManager init: Deferring team member: {}'.format(member_root_name))
 
             # Init Orgs
-            if config_parser.has_section('organizations'):
-                for org_name in config_parser.get('organizations', 'org_names').split(','):
+            if 'organizations' in sections:
+                org_options = sections['organizations']
+                for org_name in org_options['org_names'].split(','):
+                    # No orgs defined saves as an empty org_names
+                    if org_name == '':
+                        continue
                     new_org = set()
-                    for team_name in config_parser.get('organizations', org_name).split(','):
-                        new_org.add(team_name)
+                    # Option names are stored lowercased, as RawConfigParser does
+                    for team_name in org_options[org_name.lower()].split(','):
+                        new_org.add(sys.intern(team_name))
                     result._organizations[org_name] = new_org
 
             return result
-        except (AttributeError, ValueError, IOError) as e:
-            print('Exception during creation of TeamManager. Config file name: {}. Exception stack follows:'.format(os.path.join(conf_dir, 'teams.cfg')))
+        except (AttributeError, ValueError, IOError, KeyError) as e:
+            print('Exception during creation of TeamManager. Config file name: {}. Exception stack follows:'.format(config_path))
             traceback.print_exc()
             raise e
 
-    def _save_config(self) -> None:
+    @staticmethod
+    def _read_config_sections(content: str) -> Dict[str, Dict[str, str]]:
+        """
+        Single pass reader for the flat [section] / key = value layout that _save_config writes, avoiding the regex
+        machinery of RawConfigParser. Option names are lowercased to match RawConfigParser. Anything outside that
+        layout (comments, continuation lines, ':' delimiters, repeated sections or options) falls back to
+        RawConfigParser, so it parses or raises exactly as before.
+        :param content: text of teams.cfg
+        :return: dict of section name to dict of option name to value
+        """
+        result = {}  # type: Dict[str, Dict[str, str]]
+        section = None  # type: Optional[Dict[str, str]]
+        for line in content.splitlines():
+            if line == '' or line.isspace():
+                continue
+            if line[0] in ' \t#;':
+                return TeamManager._read_config_sections_fallback(content)
+            line = line.rstrip()
+            if line[0] == '[' and line[-1] == ']':
+                if line[1:-1] in result:
+                    return TeamManager._read_config_sections_fallback(content)
+                section = result[line[1:-1]] = {}
+                continue
+            key, delim, value = line.partition('=')
+            key = key.strip().lower()
+            if section is None or delim == '' or ':' in key or key in section:
+                return TeamManager._read_config_sections_fallback(content)
+            section[key] = value.strip()
+        return result
+
+    @staticmethod
+    def _read_config_sections_fallback(content: str) -> Dict[str, Dict[str, str]]:
         config_parser = configparser.RawConfigParser()
-        # Save team names comma delim
-        config_parser.add_section('manager')
-
-        # Root names are name:jira_conn_name
-        # Need to append a comma if we only have 1, else it'll treat it as an array of char instead of array of str on read
-        root_names = ','.join([x.root_name for x in list(self._teams.values())])
-        if len(list(self._teams.values())) == 1:
-            root_names = root_names + ','
+        config_parser.read_string(content)
+        return {section: dict(config_parser.items(section)) for section in config_parser.sections()}
+
+    def _save_config(self) -> None:
+        # Root names are name:jira_conn_name. from_file splits on ',' and skips empty entries, so a single team needs no
+        # trailing comma; files written with one still load.
+        root_names = ','.join(team.root_name for team in self._teams.values())
         print('Saving root names as: {}'.format(root_names))
-        config_parser.set('manager', 'team_names', root_names)
 
-        for team in list(self._teams.values()):
-            for member in team.members:
-                member.save_config(config_parser)
+        def write_config(config_file: TextIO) -> None:
+            # Writes sections in the same layout RawConfigParser writes, read back by _read_config_sections
+            # Save team names comma delim
+            config_file.write('[manager]\nteam_names = {}\n\n'.format(root_names))
+
+            for team in self._teams.values():
+                for member in team.members:
+                    member.write_ini(config_file)
+
+            # [organizations] [org_names=org_1, org_2, org_3]
+            # [organizations] [org=team_1, team_2, team_3]
+            config_file.write('[organizations]\norg_names = {}\n'.format(','.join(self._organizations)))
+            for org, team_names in self._organizations.items():
+                config_file.write('{} = {}\n'.format(org, ','.join(team_names)))
+            config_file.write('\n')
+
+        buffer = io.StringIO()
+        write_config(buffer)
+        content = buffer.getvalue()
+        self._dirty = False
+
+        content_hash = TeamManager._hash_config(content)
+        if content_hash == self._last_saved_hash:
+            argus_debug('teams.cfg unchanged. Skipping save.')
+            return
 
-        # [organizations] [org_names=org_1, org_2, org_3]
-        # [organizations] [org=team_1, team_2, team_3]
-        config_parser.add_section('organizations')
-        config_parser.set('organizations', 'org_names', ','.join(list(self._organizations.keys())))
-        for org in self._organizations.keys():
-            config_parser.set('organizations', org, ','.join(list(self._organizations[org])))
+        def write_content(config_file: TextIO) -> None:
+            config_file.write(content)
 
         config_path = os.path.join(conf_dir, 'teams.cfg')
-        save_argus_config(config_parser, config_path)
+        write_argus_config(config_path, write_content)
+        self._last_saved_hash = content_hash
+
+    @staticmethod
+    def _hash_config(content: str) -> str:
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def _save_if_dirty(self) -> None:
+        """
+        Writes teams.cfg once at the end of a batch of edits, if any of them changed anything
+        """
+        if self._dirty:
+            self._save_config()
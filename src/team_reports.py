@@ -13,14 +13,11 @@
 # limitations under the License.
 
 import datetime
-import itertools
-
-from dateutil import parser
 
 from src.jira_issue import JiraIssue
 from src.member_issues_by_status import MemberIssuesByStatus
 from src.utils import get_input
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 
 
 class ReportType:
@@ -35,20 +32,17 @@ class ReportType:
 
     @classmethod
     def from_int(cls, value: int) -> int:
-        if value == 1:
-            return ReportType.MOMENTUM
-        elif value == 2:
-            return ReportType.CURRENT_LOAD
-        elif value == 3:
-            return ReportType.TEST_LOAD
-        elif value == 4:
-            return ReportType.REVIEW_LOAD
-        elif value == 5:
-            return ReportType.FIXVERSION
-        elif value == 6:
-            return ReportType.META
-        else:
-            return ReportType.UNKNOWN
+        return _REPORT_TYPES_BY_INT.get(value, ReportType.UNKNOWN)
+
+
+_REPORT_TYPES_BY_INT = {
+    1: ReportType.MOMENTUM,
+    2: ReportType.CURRENT_LOAD,
+    3: ReportType.TEST_LOAD,
+    4: ReportType.REVIEW_LOAD,
+    5: ReportType.FIXVERSION,
+    6: ReportType.META
+}  # type: Dict[int, int]
 
 
 class ReportFilter:
@@ -74,21 +68,32 @@ class ReportFilter:
         # JiraIssue keys, used to determine if report contains issue in question
         self.known_issues = set()  # type: Set[str]
 
+        # id(JiraIssue) -> self.matches result for the member being processed, as several columns can draw from the
+        # same source issues. Reset in clear, which runs before each member's process_issues.
+        self._match_cache = {}  # type: Dict[int, bool]
+
+        # Row formats for column_headers and print_all_counts. Built on first use, once child classes have set columns.
+        self._headers_format = None  # type: Optional[str]
+        self._counts_format = None  # type: Optional[str]
+
         # Many reports are time-bound, so we store this here for convenience rather than replicating it in each child class
-        # This should be stored as a datetime object
-        self.since = None  # type: Optional[datetime.datetime]
+        # This should be stored as a datetime object. Set through the since property, which validates it.
+        self._since = None  # type: Optional[datetime.datetime]
+
+        # self._since as a POSIX timestamp, kept in step by the since setter so _matches_time compares floats
+        self._since_timestamp = None  # type: Optional[float]
 
     def clear(self) -> None:
         for column in self.columns:
             self.issues[column] = []
         self.known_issues = set()
+        self._match_cache = {}
 
     def column_headers(self) -> str:
         # 4 pad to cover #'s for detail breakdown
-        result = '{:<{width}.{width}} '.format('Name', width=self.name_width)
-        for column in self.columns:
-            result += '{:<{width}.{width}}'.format(column, width=self.col_width)
-        return result
+        if self._headers_format is None:
+            self._headers_format = '{{:<{0}.{0}}} '.format(self.name_width) + '{{:<{0}.{0}}}'.format(self.col_width) * len(self.columns)
+        return self._headers_format.format('Name', *self.columns)
 
     def process_issues(self, member_issues: MemberIssuesByStatus) -> None:
         raise NotImplementedError()
@@ -96,24 +101,42 @@ class ReportFilter:
     def matches(self, jira_issue: JiraIssue) -> bool:
         raise NotImplementedError()
 
-    def _add_matching_issues(self, column_name: str, jira_issues: List[JiraIssue]) -> None:
+    def _add_matching_issues(self, column_name: str, jira_issues: Iterable[JiraIssue]) -> None:
         """
         Adds issues matching this report filters criteria to the specified column. Relies on self.matches to determine
         which issues match what this report is looking for
         """
-        matching_issues = [x for x in jira_issues if self.matches(x)]
-        self.issues[column_name].extend(matching_issues)
-        for jira_issue in matching_issues:
-            self.known_issues.add(jira_issue.issue_key)
+        # Bound once up front as this runs for every issue in every column
+        matches = self._cached_matches
+        column = self.issues[column_name]
+        add_known = self.known_issues.add
+        for jira_issue in jira_issues:
+            if matches(jira_issue):
+                column.append(jira_issue)
+                add_known(jira_issue.issue_key)
+
+    def _cached_matches(self, jira_issue: JiraIssue) -> bool:
+        result = self._match_cache.get(id(jira_issue))
+        if result is None:
+            result = self.matches(jira_issue)
+            self._match_cache[id(jira_issue)] = result
+        return result
+
+    def _add_issue(self, column_name: str, jira_issue: JiraIssue) -> None:
+        """
+        Adds a single issue already known to match this report to the specified column
+        """
+        self.issues[column_name].append(jira_issue)
+        self.known_issues.add(jira_issue.issue_key)
 
     def issue_count(self, issue_type: str) -> int:
         return len(self.issues[issue_type])
 
     def print_all_counts(self, name: str) -> str:
-        result = '{:<{width}.{width}} '.format(name, width=self.name_width)
-        for column in self.columns:
-            result += '{:<{width}}'.format(len(self.issues[column]), width=self.col_width)
-        return result
+        if self._counts_format is None:
+            self._counts_format = '{{:<{0}.{0}}} '.format(self.name_width) + '{{:<{0}}}'.format(self.col_width) * len(self.columns)
+        issues = self.issues
+        return self._counts_format.format(name, *[len(issues[column]) for column in self.columns])
 
     def get_issues(self, issue_type: str) -> List[JiraIssue]:
         return self.issues[issue_type]
@@ -130,6 +153,19 @@ class ReportFilter:
     def print_description(self) -> None:
         print(self.description)
 
+    @property
+    def since(self) -> Optional[datetime.datetime]:
+        return self._since
+
+    @since.setter
+    def since(self, value: Optional[datetime.datetime]) -> None:
+        # As we expect since to be set externally, we assert that it's been set correctly here, once, rather than on
+        # every _matches_time call
+        assert value is None or isinstance(value, datetime.datetime),\
+            'Attempted to set incorrectly formatted since. Expected datetime.datetime type, got: {}'.format(type(value))
+        self._since = value
+        self._since_timestamp = None if value is None else value.timestamp()
+
     @staticmethod
     def get_since() -> str:
         return get_input('Since what date? (-2m or -1y or -5w or -2d, etc)')
@@ -151,19 +187,11 @@ class ReportFilter:
         """
         Compares against self.since to determine if the jira_issue should be included or not
         """
-        # JIRA resolutiondate time format: 2016-12-12T08:58:11.588-0600
-        assert self.since is not None, 'Attempted to match time against ReportFilter without initialized self.since'
-
-        # As we expect self.since to be set externally, we need to assert that it's been set correctly before attempting to use it
-        assert isinstance(self.since, datetime.datetime),\
-            'Attempted to match time against incorrectly formatted self.since. Expected datetime.datetime type, got: {}'.format(type(self.since))
-
-        # Currently open tickets match any time bound as we strictly do >= comparisons
-        if jira_issue.is_open or jira_issue.resolved is None or jira_issue.resolved == 'None':
-            return True
-
-        issue_time = parser.parse(jira_issue.resolved)
-        return issue_time >= self.since
+        # JIRA resolutiondate time format: 2016-12-12T08:58:11.588-0600. Type of since is checked by its setter.
+        # Currently open or unresolved tickets (no resolved_timestamp) match any time bound as we strictly do >= comparisons
+        assert self._since_timestamp is not None, 'Attempted to match time against ReportFilter without initialized self.since'
+        resolved = jira_issue.resolved_timestamp
+        return resolved is None or resolved >= self._since_timestamp
 
     def print_all_keys(self) -> None:
         print('Printing all keys for report: {}. Total count: {}'.format(self.header, len(self.issues)))
@@ -186,8 +214,13 @@ class ReportMomentum(ReportFilter):
     def process_issues(self, member_issues: MemberIssuesByStatus) -> None:
         assert member_issues is not None, 'process_issues call on a null MemberIssuesByStatus object.'
 
-        self._add_matching_issues('Closed non-test', [x for x in member_issues.closed if not x.is_test])
-        self._add_matching_issues('Closed Test', [x for x in member_issues.closed if x.is_test])
+        # Split closed into test and non-test in one pass rather than scanning it once per column
+        closed_non_test = []  # type: List[JiraIssue]
+        closed_test = []  # type: List[JiraIssue]
+        for jira_issue in member_issues.closed:
+            (closed_test if jira_issue.is_test else closed_non_test).append(jira_issue)
+        self._add_matching_issues('Closed non-test', closed_non_test)
+        self._add_matching_issues('Closed Test', closed_test)
         self._add_matching_issues('Reviewed', member_issues.reviewed)
 
     def matches(self, jira_issue: JiraIssue) -> bool:
@@ -214,12 +247,25 @@ class ReportCurrentLoad(ReportFilter):
         self.issues = {'bug': [], 'test': [], 'feature': [], 'review': [], 'PA review': [], 'Total': []}
 
     def process_issues(self, member_issues: MemberIssuesByStatus) -> None:
-        self._add_matching_issues('bug', [x for x in member_issues.assigned if 'Bug' == x.issuetype])
-        self._add_matching_issues('test', [x for x in member_issues.assigned if x.is_test])
-        self._add_matching_issues('feature', [x for x in member_issues.assigned if x.is_feature])
-        self._add_matching_issues('review', [x for x in member_issues.reviewer if 'Patch Available' != x.status])
-        self._add_matching_issues('PA review', [x for x in member_issues.reviewer if 'Patch Available' == x.status])
-        self._add_matching_issues('Total', [x for x in itertools.chain(member_issues.assigned, member_issues.reviewer)])
+        # One pass per source list; an assigned issue can land in several of bug / test / feature, and every matching
+        # issue counts toward Total, assigned first then reviewer. The matches check is inlined as is_open, as this runs
+        # for every issue of every member on the team.
+        add = self._add_issue
+        for jira_issue in member_issues.assigned:
+            if not jira_issue.is_open:
+                continue
+            if 'Bug' == jira_issue.issuetype:
+                add('bug', jira_issue)
+            if jira_issue.is_test:
+                add('test', jira_issue)
+            if jira_issue.is_feature:
+                add('feature', jira_issue)
+            add('Total', jira_issue)
+        for jira_issue in member_issues.reviewer:
+            if not jira_issue.is_open:
+                continue
+            add('PA review' if 'Patch Available' == jira_issue.status else 'review', jira_issue)
+            add('Total', jira_issue)
 
     def matches(self, jira_issue: JiraIssue) -> bool:
         # Want unresolved issues only for open report. Don't need to time bound
@@ -250,56 +296,44 @@ class ReportMeta(ReportFilter):
     col_width = 5
     description = 'Key: C=Critical, H=High, E=Else, X=Test, T=Total, A=Assignee, R=Reviewer, prefix C=Closed'
 
+    # (MemberIssuesByStatus list, critical column, high column, other priority column, test column, total column,
+    #  whether tests count toward the total). First half -> the open issues, second half -> the closed issues, where
+    #  totals exclude tests.
+    _PRIORITY_RULES = (
+        ('assigned', 'CA', 'HA', 'EA', 'XA', 'TA', True),
+        ('reviewer', 'CR', 'HR', 'ER', 'XR', 'TR', True),
+        ('closed', 'CCA', 'CHA', 'CEA', 'CXA', 'CTA', False),
+        ('reviewed', 'CCR', 'CHR', 'CER', 'CXR', 'CTR', False),
+    )
+
     def __init__(self) -> None:
         ReportFilter.__init__(self)
         self.columns = ['CA', 'CR', 'HA', 'HR', 'EA', 'ER', 'XA', 'XR', 'TA', 'TR', 'CCA', 'CCR', 'CHA', 'CHR', 'CEA', 'CER', 'CXA', 'CXR', 'CTA', 'CTR']
-        self.issues = {
-            'CA': [],
-            'CR': [],
-            'HA': [],
-            'HR': [],
-            'EA': [],
-            'ER': [],
-            'XA': [],
-            'XR': [],
-            'TA': [],
-            'TR': [],
-            'CCA': [],
-            'CCR': [],
-            'CHA': [],
-            'CHR': [],
-            'CEA': [],
-            'CER': [],
-            'CXA': [],
-            'CXR': [],
-            'CTA': [],
-            'CTR': []
-        }
+        self.issues = {column: [] for column in self.columns}
 
     def process_issues(self, member_issues: MemberIssuesByStatus) -> None:
-        # First half -> the open issues
-        self._add_matching_issues('CA', [x for x in member_issues.assigned if 'Critical' == x.priority and x.not_test])
-        self._add_matching_issues('CR', [x for x in member_issues.reviewer if 'Critical' == x.priority and x.not_test])
-        self._add_matching_issues('HA', [x for x in member_issues.assigned if 'High' == x.priority and x.not_test])
-        self._add_matching_issues('HR', [x for x in member_issues.reviewer if 'High' == x.priority and x.not_test])
-        self._add_matching_issues('EA', [x for x in member_issues.assigned if x.mid_low_prio and x.not_test])
-        self._add_matching_issues('ER', [x for x in member_issues.reviewer if x.mid_low_prio and x.not_test])
-        self._add_matching_issues('XA', [x for x in member_issues.assigned if x.is_test])
-        self._add_matching_issues('XR', [x for x in member_issues.reviewer if x.is_test])
-        self._add_matching_issues('TA', member_issues.assigned)
-        self._add_matching_issues('TR', member_issues.reviewer)
-
-        # Second half -> the closed issues
-        self._add_matching_issues('CCA', [x for x in member_issues.closed if 'Critical' == x.priority and x.not_test])
-        self._add_matching_issues('CCR', [x for x in member_issues.reviewed if 'Critical' == x.priority and x.not_test])
-        self._add_matching_issues('CHA', [x for x in member_issues.closed if 'High' == x.priority and x.not_test])
-        self._add_matching_issues('CHR', [x for x in member_issues.reviewed if 'High' == x.priority and x.not_test])
-        self._add_matching_issues('CEA', [x for x in member_issues.closed if x.mid_low_prio and x.not_test])
-        self._add_matching_issues('CER', [x for x in member_issues.reviewed if x.mid_low_prio and x.not_test])
-        self._add_matching_issues('CXA', [x for x in member_issues.closed if x.is_test])
-        self._add_matching_issues('CXR', [x for x in member_issues.reviewed if x.is_test])
-        self._add_matching_issues('CTA', [x for x in member_issues.closed if x.not_test])
-        self._add_matching_issues('CTR', [x for x in member_issues.reviewed if x.not_test])
+        for source, critical, high, other, test, total, total_includes_tests in self._PRIORITY_RULES:
+            self._add_by_priority(getattr(member_issues, source), critical, high, other, test, total, total_includes_tests)
+
+    def _add_by_priority(self, jira_issues: List[JiraIssue], critical: str, high: str, other: str, test: str, total: str,
+                         total_includes_tests: bool) -> None:
+        """
+        Single pass over jira_issues, evaluating matches and the test / priority split once per issue rather than once
+        per column. Non-test issues go to the column for their priority, tests to the test column.
+        """
+        add = self._add_issue
+        matches = self.matches
+        for jira_issue in jira_issues:
+            if not matches(jira_issue):
+                continue
+            if jira_issue.is_test:
+                add(test, jira_issue)
+                if total_includes_tests:
+                    add(total, jira_issue)
+                continue
+            priority = jira_issue.priority
+            add(critical if priority == 'Critical' else high if priority == 'High' else other, jira_issue)
+            add(total, jira_issue)
 
     def matches(self, jira_issue: JiraIssue) -> bool:
         return self._matches_time(jira_issue)
@@ -327,7 +361,7 @@ class ReportFixVersion(ReportFilter):
     def process_issues(self, member_issues: MemberIssuesByStatus) -> None:
         assert member_issues is not None, 'process_issues call on a null MemberIssuesByStatus object.'
 
-        self._add_matching_issues('Assigned', [x for x in member_issues.assigned])
+        self._add_matching_issues('Assigned', member_issues.assigned)
         self._add_matching_issues('Closed non-test', [x for x in member_issues.closed if not x.is_test])
         self._add_matching_issues('Closed Test', [x for x in member_issues.closed if x.is_test])
         self._add_matching_issues('Reviewed', member_issues.reviewed)
@@ -395,8 +429,13 @@ class ReportReviewLoad(ReportFilter):
         self.issues = {'reviewer': [], 'PA reviewer': [], 'reviewed': []}
 
     def process_issues(self, member_issues: MemberIssuesByStatus) -> None:
-        self._add_matching_issues('reviewer', [x for x in member_issues.reviewer if x.status != 'Patch Available'])
-        self._add_matching_issues('PA reviewer', [x for x in member_issues.reviewer if x.status == 'Patch Available'])
+        # As in ReportMomentum, reviewer is partitioned by status in a single pass
+        not_patch_available = []  # type: List[JiraIssue]
+        patch_available = []  # type: List[JiraIssue]
+        for jira_issue in member_issues.reviewer:
+            (patch_available if jira_issue.status == 'Patch Available' else not_patch_available).append(jira_issue)
+        self._add_matching_issues('reviewer', not_patch_available)
+        self._add_matching_issues('PA reviewer', patch_available)
         self._add_matching_issues('reviewed', member_issues.reviewed)
 
     def matches(self, jira_issue: JiraIssue) -> bool:
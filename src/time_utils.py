@@ -13,17 +13,48 @@
 # limitations under the License.
 
 import re
-from datetime import datetime
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Dict, Pattern
 
 import pytz
+from dateutil import parser
 from dateutil.relativedelta import relativedelta
 
 from src import utils
 
 
+# Layout of JIRA timestamps, e.g. resolutiondate: 2016-12-12T08:58:11.588-0600
+_JIRA_TIME_LENGTH = len('2016-12-12T08:58:11.588-0600')
+
+# UTC offset suffix, e.g. '-0600', to tzinfo. Issues share a handful of offsets so each is only built once.
+_jira_timezones = {}  # type: Dict[str, tzinfo]
+
+# Patterns for each unit accepted by since, e.g. '-2m' or '3w', compiled once rather than per call
+_TIME_PATTERNS = {char: re.compile('([-0-9]+){}'.format(char)) for char in 'dwmy'}  # type: Dict[str, Pattern]
+
+
+def parse_jira_time(value: str) -> datetime:
+    """
+    Parses a JIRA timestamp. JIRA always uses the fixed layout above, so that's sliced directly rather than going through
+    dateutil's general purpose parser, which remains the fallback for anything else.
+    """
+    if len(value) == _JIRA_TIME_LENGTH and value[10] == 'T' and value[19] == '.' and value[23] in '+-':
+        try:
+            tz = _jira_timezones.get(value[23:])
+            if tz is None:
+                offset = timedelta(hours=int(value[24:26]), minutes=int(value[26:28]))
+                tz = timezone(-offset if value[23] == '-' else offset)
+                _jira_timezones[value[23:]] = tz
+            return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                            int(value[11:13]), int(value[14:16]), int(value[17:19]), int(value[20:23]) * 1000, tz)
+        except ValueError:
+            pass
+    return parser.parse(value)
+
+
 def current_time() -> datetime:
-    # Implementation lifted from: https://stackoverflow.com/questions/4530069/python-how-to-get-a-value-of-datetime-today-that-is-timezone-aware
-    return datetime.utcnow().replace(tzinfo=pytz.utc)
+    # Timezone-aware now, built directly in UTC rather than via utcnow() and a replace
+    return datetime.now(pytz.utc)
 
 
 def since_now(delta: str) -> datetime:
@@ -39,15 +70,19 @@ def since(source: datetime, delta: str) -> datetime:
     week_delta = _extract_time('w', delta)
     month_delta = _extract_time('m', delta)
     year_delta = _extract_time('y', delta)
-    utils.argus_debug('since input source: {}. delta: [{}]. days:{} weeks:{} months:{} years:{}'.format(
-        source, delta, day_delta, week_delta, month_delta, year_delta
-    ))
+    if utils.debug:
+        utils.argus_debug('since input source: {}. delta: [{}]. days:{} weeks:{} months:{} years:{}'.format(
+            source, delta, day_delta, week_delta, month_delta, year_delta
+        ))
 
+    # Only months and years need relativedelta's calendar arithmetic; fixed day counts go through the C timedelta
+    if month_delta == 0 and year_delta == 0:
+        return source + timedelta(days=day_delta, weeks=week_delta)
     return source + relativedelta(days=day_delta, weeks=week_delta, months=month_delta, years=year_delta)
 
 
 def _extract_time(char: str, input: str) -> int:
-    result_match = re.search('([-0-9]+){}'.format(char), input)
+    result_match = _TIME_PATTERNS[char].search(input)
     if result_match:
         return int(result_match.group(1))
     return 0
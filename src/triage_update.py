@@ -12,16 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import csv
 import sys
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 
 from typing import Dict, List, Optional
 
 from src.jira_connection import JiraConnection
 from src.jira_project import JiraProject
 from src.jira_issue import JiraIssue
-from src.utils import time_format_string
+from src.utils import time_format
+
+# Upper bound on concurrently refreshed JiraConnections at the start of TriageUpdate.process
+_MAX_REFRESH_WORKERS = 8
+
+# Fixed rows of the triage csv written by TriageUpdate._print_csv
+_CSV_TITLE_FORMAT = 'Last updated w/Argus,{},,Master Link:,{}\n'
+_CSV_MASTER_LINK = '=HYPERLINK(CONCATENATE(if(regexmatch(B4, $O$3), $P$3, $R$3), B4),"Link")'
+_CSV_COLUMN_HEADERS = ',Key,Summary,assignee,reviewer,status,resolution,Prio,Repro,Scope,Type,Component,,\n'
+
+# str.translate tables stripping " and replacing , in a single pass. Fields read from the csv swap , for ;, while fields
+# pulled from JIRA through TriageIssue.sanitize swap it for a space.
+_CSV_FIELD_TRANSLATION = str.maketrans({',': ';', '"': None})
+_JIRA_FIELD_TRANSLATION = str.maketrans({',': ' ', '"': None})
 
 
 class TriageUpdate:
@@ -39,67 +55,83 @@ class TriageUpdate:
         self._closed_issues: List[TriageIssue] = []
 
     def process(self, in_file_name: str, out_file_name: str = None) -> None:
-        # Update jira projects before querying
-        for name, jp in self._jira_projects.items():
-            jp.refresh()
-
-        with open(in_file_name, 'r') as issue_file:
-            temp_issues = []
-            # First, get the .csv data into TriageIssue objects to be updated
-            for line in issue_file:
-                if 'Last argus cleaning' in line or 'Open Issues' in line:
-                    continue
-                line = line.rstrip()
-                ti = TriageIssue(line)
+        # Update jira projects before querying. Projects on the same connection share its jira client and HTTP session,
+        # so each connection's projects are refreshed serially within one worker and no connection is shared across
+        # threads. Separate connections refresh concurrently. map() re-raises any worker's exception here.
+        projects_by_connection: Dict[Optional[str], List[JiraProject]] = {}
+        for jira_project in self._jira_projects.values():
+            connection_name = jira_project.jira_connection.connection_name if jira_project.jira_connection else None
+            projects_by_connection.setdefault(connection_name, []).append(jira_project)
+
+        def refresh_all(jira_projects: List[JiraProject]) -> None:
+            for jira_project in jira_projects:
+                jira_project.refresh()
+
+        with ThreadPoolExecutor(max_workers=max(1, min(_MAX_REFRESH_WORKERS, len(projects_by_connection)))) as executor:
+            list(executor.map(refresh_all, projects_by_connection.values()))
+
+        # Index each project to the first connection that lists it, so each issue is a single lookup rather than a scan of
+        # every connection's project list
+        connections_by_project: Dict[str, JiraConnection] = {}
+        for conn in self._jira_connections.values():
+            for project_name in conn.possible_projects:
+                connections_by_project.setdefault(project_name, conn)
+
+        with open(in_file_name, 'r', newline='') as issue_file:
+            # Each .csv row is parsed into a TriageIssue, then its project name is linked to a JiraConnection, so we can
+            # use the connection_name to build a complex name and map to an offline cached JiraProject. Done in one pass
+            # over the file, with csv.reader splitting the rows.
+            missed = False
+            failed_update = False
+            rows = csv.reader(line for line in issue_file if 'Last argus cleaning' not in line and 'Open Issues' not in line)
+            for row in rows:
                 # Skip header or empty rows
-                if ti.key == '' or ti.key == 'Key':
+                if len(row) < 2 or row[1] == '' or row[1] == 'Key':
                     continue
-                temp_issues.append(ti)
+                triage_issue = TriageIssue(row)
 
-            # Parse out project name and link to JiraConnection, so we can use the connection_name to build a
-            # complex name and map to an offline cached JiraProject.
-            missed = False
-            for triage_issue in temp_issues:
-                found = False
-                for name, conn in self._jira_connections.items():
-                    if conn.contains_project(triage_issue.project):
-                        found = True
-                        triage_issue.set_connection_name(conn.connection_name)
-                        try:
-                            jira_project = self._jira_projects[triage_issue.project]
-
-                            # Grab the data from the offline cached results and update our TriageIssue with it
-                            jira_issue = jira_project.get_issue(triage_issue.key)
-                            if jira_issue is None:
-                                print('WARNING! Got null JiraIssue for key: [{}]. Skipping.'.format(triage_issue.key))
-                                continue
-
-                            # Update the contents of the triage issue before adding it to one of our result sets
-                            triage_issue.update_self(jira_issue, jira_project)
-
-                            # we can now determine if this is an open or closed issue
-                            if jira_issue.is_open:
-                                self._open_issues.append(triage_issue)
-                            else:
-                                self._closed_issues.append(triage_issue)
-                            break
-                        except ValueError as e:
-                            print('---------------------------------------')
-                            print('Encountered exception on issue: {}. Exception: {}'.format(triage_issue, e))
-                            traceback.print_exc()
-                            print('It\'s possible you haven\'t cached a jira project locally for issue: {}'.format(triage_issue))
-                            for name, jira_project in self._jira_projects.items():
-                                print('Known jira projects cached locally: {}'.format(name))
-                            print('---------------------------------------')
-                if not found:
+                owning_conn = connections_by_project.get(triage_issue.project)
+                if owning_conn is None:
                     print('Failed to find any Jira Connection that owned the issue: {}. Will not update.'.format(triage_issue.key))
                     print('Attempted to find project name: [{}]'.format(triage_issue.project))
-                    print('Enumerating known projects:')
-                    for name, conn in self._jira_connections.items():
-                        print('conn name: {}'.format(name))
-                        print('known projects: {}'.format(','.join(conn.possible_projects)))
-                        print('result of whether this conn knows that project: {}'.format(conn.contains_project(triage_issue.project)))
+                    # The known connections don't change between rows, so they're only listed for the first miss
+                    if not missed:
+                        print('Enumerating known projects:')
+                        for name, known_conn in self._jira_connections.items():
+                            print('conn name: {}'.format(name))
+                            print('known projects: {}'.format(','.join(known_conn.possible_projects)))
                     missed = True
+                    continue
+
+                triage_issue.set_connection_name(owning_conn.connection_name)
+                try:
+                    jira_project = self._jira_projects[triage_issue.project]
+
+                    # Grab the data from the offline cached results and update our TriageIssue with it
+                    jira_issue = jira_project.get_issue(triage_issue.key)
+                    if jira_issue is None:
+                        print('WARNING! Got null JiraIssue for key: [{}]. Skipping.'.format(triage_issue.key))
+                        continue
+
+                    # Update the contents of the triage issue before adding it to one of our result sets
+                    triage_issue.update_self(jira_issue, jira_project)
+
+                    # we can now determine if this is an open or closed issue
+                    if jira_issue.is_open:
+                        self._open_issues.append(triage_issue)
+                    else:
+                        self._closed_issues.append(triage_issue)
+                except ValueError as e:
+                    print('---------------------------------------')
+                    print('Encountered exception on issue: {}. Exception: {}'.format(triage_issue, e))
+                    traceback.print_exc()
+                    print('It\'s possible you haven\'t cached a jira project locally for issue: {}'.format(triage_issue))
+                    # As above, the cached projects are only listed on the first failure
+                    if not failed_update:
+                        for name in self._jira_projects:
+                            print('Known jira projects cached locally: {}'.format(name))
+                    failed_update = True
+                    print('---------------------------------------')
             if missed:
                 print('Use the projects menu in the interface to locally cache data from that project in order to run triage.')
 
@@ -116,22 +148,21 @@ class TriageUpdate:
         exit(0)
 
     def _print_csv(self, out_handle) -> None:
+        # The whole csv is assembled first and handed to out_handle in a single writelines call, which feeds the rows
+        # through the file's buffer without first joining them into one more copy
+        lines = [_CSV_TITLE_FORMAT.format(time.strftime(time_format), _CSV_MASTER_LINK), 'Open Issues\n', _CSV_COLUMN_HEADERS]
         count = 0
-        out_handle.write('Last updated w/Argus,{},,Master Link:,{}\n'.format(
-            time.strftime(time_format_string()), '=HYPERLINK(CONCATENATE(if(regexmatch(B4, $O$3), $P$3, $R$3), B4),"Link")'))
-        out_handle.write('Open Issues\n')
-        out_handle.write(',Key,Summary,assignee,reviewer,status,resolution,Prio,Repro,Scope,Type,Component,,\n')
         for triage_issue in self._open_issues:
             try:
-                out_handle.write('{}\n'.format(triage_issue))
+                lines.append('{}\n'.format(triage_issue))
                 count += 1
             except (ValueError, TypeError) as e:
                 print('Failed to output line. issue key with problem field: {}. Exception: {}'.format(triage_issue.key, e))
-        out_handle.write('\n')
-        out_handle.write('Closed Issues\n')
-        for triage_issue in self._closed_issues:
-            out_handle.write('{}\n'.format(triage_issue))
-            count += 1
+        lines.append('\n')
+        lines.append('Closed Issues\n')
+        lines.extend(['{}\n'.format(triage_issue) for triage_issue in self._closed_issues])
+        count += len(self._closed_issues)
+        out_handle.writelines(lines)
         print('Wrote {} issues to {}'.format(count, out_handle))
 
     @staticmethod
@@ -141,10 +172,10 @@ class TriageUpdate:
             if i.prio == 'N':
                 i.set_component('ZZZ')
 
-        triaged_issues.sort(key=lambda x: x.scope, reverse=True)
-        triaged_issues.sort(key=lambda x: x.repro, reverse=True)
-        triaged_issues.sort(key=lambda x: x.prio, reverse=False)
-        triaged_issues.sort(key=lambda x: x.component, reverse=False)
+        # repro and scope are descending while component and prio ascend, and strings can't be negated into one tuple key,
+        # so this is two stable sorts on tuple keys rather than one per field
+        triaged_issues.sort(key=attrgetter('repro', 'scope'), reverse=True)
+        triaged_issues.sort(key=attrgetter('component', 'prio'))
 
 
 class TriageIssue:
@@ -168,18 +199,19 @@ class TriageIssue:
     type_index = 10
     component_index = 11
 
-    def __init__(self, line: str) -> None:
+    def __init__(self, fields: List[str]) -> None:
         """
-        When we init from .csv, we assume we don't need to sanitize each field. Mostly because we *can't* init from
-        .csv if we have , in the middle of fields... since it wouldn't be csv.
+        :param fields: One row of the triage .csv, as split by csv.reader. Quoted fields may contain , and " so those are
+        swapped out below.
         """
-        sa = line.split(',')
         self._jira_project = None  # type: Optional[JiraProject]
         self._connection_name = ''  # type: str
-        self._data = sa  # type: List[str]
+        self._data = fields  # type: List[str]
         # Strip out , and " from strings
         for i in range(0, len(self._data) - 1):
-            self._data[i] = self._data[i].replace(',', ';').replace('"', '')
+            self._data[i] = self._data[i].translate(_CSV_FIELD_TRANSLATION)
+        # The key is never rewritten, so its project is split out once here
+        self._project = self._data[1].partition('-')[0]  # type: str
 
     @property
     def key(self) -> str:
@@ -190,7 +222,7 @@ class TriageIssue:
         """
         Returns string representation consisting of the first half of the PROJECT-#### JIRA key
         """
-        return self._data[1].split('-')[0]
+        return self._project
 
     @property
     def scope(self) -> str:
@@ -230,20 +262,17 @@ class TriageIssue:
         self._data[self.type_index] = self.validate(jira_issue.issuetype)
         self._data[self.prio_index] = self.validate(jira_issue.priority)
 
-        combined = set()
+        # Component from JiraIssue is in the form of a JiraComponent object.
+        combined = set(jira_issue.component_list)
         # Assume raw text string for component comes from .csv
-        if self.component != '':
+        if self.component:
             combined.add(self.component)
-
-        # Component from JiraIssue is in the form of a JiraComponent object.
-        for component in jira_issue.component_list:
-            combined.add(component)
-        self._data[self.component_index] = ':'.join(combined)
+        # Sorted so the written csv doesn't reorder components from one run to the next
+        self._data[self.component_index] = ':'.join(sorted(combined))
 
     def _get_reviewer(self, jira_issue: JiraIssue) -> str:
-        if self.reviewer_field in jira_issue:
-            return jira_issue[self.reviewer_field]
-        return 'unassigned'
+        # Translated once per issue rather than once for the check and again for the read
+        return jira_issue.get(self.reviewer_field, 'unassigned')
 
     @staticmethod
     def sanitize(field: str) -> str:
@@ -254,7 +283,7 @@ class TriageIssue:
         """
         if field is None:
             return ''
-        return field.replace(',', ' ').replace('"', '')
+        return field.translate(_JIRA_FIELD_TRANSLATION)
 
     @property
     def reviewer_field(self) -> str:
@@ -282,10 +311,8 @@ class TriageIssue:
         result = 'OVERWRITEME,'
 
         try:
-            for i in range(1, len(self._data) - 2):
-                result += '{},'.format(self._data[i])
-            result += '{}'.format(self._data[len(self._data) - 1])
-            return result
+            # Every field after the link column except the second to last, joined in a single pass
+            return result + ','.join(self._data[1:-2] + self._data[-1:])
         except (ValueError, TypeError) as e:
             print('Failed to encode issue as string. key with issue: {}. Exception: {}'.format(self.key, e))
             return 'UNKNOWN - FAILURE: {}'.format(self.key)
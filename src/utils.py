@@ -12,19 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
 import base64
 import configparser
 import os
 import re
 import readline
+import stat
 import sys
 import tempfile
 import threading
 import time
 from configparser import RawConfigParser
+from functools import lru_cache
 from glob import glob
+from itertools import cycle
 from subprocess import Popen
-from typing import Any, Callable, List, Optional, TextIO, Tuple
+from typing import Any, Callable, Iterable, List, Optional, TextIO, Tuple
 from urllib import request
 
 DESCRIPTION = 'argus, command-line JIRA multi-tool'
@@ -60,10 +64,16 @@ DIR_LIST = [conf_dir, jenkins_conf_dir, jenkins_connections_dir, jenkins_views_d
 thick_separator = '=' * 50
 thin_separator = '-' * 50
 
+# strftime format for timestamps written to generated reports
+time_format = '%Y/%m/%d %H:%M'
+
 build_options_str = 'BuildOptions'
 builds_to_check_str = 'builds_to_check'
 recent_str = 'recent_builds_to_check'
 
+# ((jenkins.cfg path, mtime), (builds_to_check, recent_builds_to_check)) from the last get_build_options parse
+_build_options_cache = None  # type: Optional[Tuple[Tuple[str, float], Tuple[int, int]]]
+
 debug = False
 argus_log = None  # type: Optional[TextIO]
 unit_test = False
@@ -76,10 +86,34 @@ def save_argus_config(config_parser: RawConfigParser, file_name: str) -> None:
     """
     Redirects saving of config file to test folder if running a unit test
     """
+    write_argus_config(file_name, config_parser.write)
+
+
+def write_argus_config(file_name: str, write: Callable[[TextIO], None]) -> None:
+    """
+    Calls write with an open handle for the config file, redirecting to the test folder if running a unit test. Writes
+    to a uniquely named temp file beside the target, syncs it, and renames it over the target so an interrupted save
+    can't leave a truncated config behind. The existing file's permissions are kept, and a symlinked config has its
+    target replaced rather than the link.
+    """
     if unit_test:
         file_name = os.path.join(TEST_DIR, file_name)
-    with open(file_name, 'w') as config_file:
-        config_parser.write(config_file)
+    file_name = os.path.realpath(file_name)
+    temp_handle, temp_name = tempfile.mkstemp(dir=os.path.dirname(file_name), prefix='{}.'.format(os.path.basename(file_name)), suffix='.tmp')
+    try:
+        with open(temp_handle, 'w', buffering=1 << 16) as config_file:
+            write(config_file)
+            config_file.flush()
+            os.fsync(config_file.fileno())
+        # mkstemp creates the temp file owner-only, which new configs keep as they may hold encoded passwords
+        if os.path.exists(file_name):
+            os.chmod(temp_name, stat.S_IMODE(os.stat(file_name).st_mode))
+        os.replace(temp_name, file_name)
+    except BaseException:
+        # Leave the original config untouched and don't strand a partial temp file next to it
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
 
 
 def build_config_name(file_name: str) -> str:
@@ -114,7 +148,7 @@ def change_browser() -> None:
 
 
 def time_format_string() -> str:
-    return '%Y/%m/%d %H:%H'
+    return time_format
 
 
 def is_win() -> bool:
@@ -133,10 +167,7 @@ def indent(num: int, value: str) -> None:
     """
     Avoiding textwrap import
     """
-    to_print = ''
-    for _ in range(num):
-        to_print += ' '
-    print(to_print + value)
+    print(' ' * num + value)
 
 
 def get_input(prompt: str, lowered: bool = True) -> str:
@@ -166,17 +197,11 @@ def encode(key: str, to_encode: str) -> str:
     Courtesy of http://stackoverflow.com/questions/2490334/simple-way-to-encode-a-string-according-to-a-password
     Mostly just looking to keep from having an easily readable password stored on the fs
     """
-    enc = []
-    for i in range(len(to_encode)):
-        key_c = key[i % len(key)]
-        enc_c = chr((ord(to_encode[i]) + ord(key_c)) % 256)
-        enc.append(enc_c)
-    # `base64.urlsafe_b64encode` takes a byte string and returns a byte string.
-    # Unfortunately, right now `enc` [after the `join`] is a unicode string, and our current function, `encode`,
-    # also wants to return a unicode string. No problem, we just have to call `.encode()` on the output of `join`,
-    # to get a bytes string to pass into `base64.urlsafe_b64encode`. Then, we call `.decode()` on the output
-    # in order to transform it from a bytes string into a unicode string.
-    return base64.urlsafe_b64encode(''.join(enc).encode()).decode()
+    # Shift each character by the repeating key in a single generator pass. Every shifted value is below 256, so latin-1
+    # maps the bytes back to the same code points; those are then utf-8 encoded for base64 as they always have been, which
+    # keeps previously saved passwords readable.
+    enc = bytes((ord(c) + ord(key_c)) % 256 for c, key_c in zip(to_encode, cycle(key)))
+    return base64.urlsafe_b64encode(enc.decode('latin-1').encode()).decode()
 
 
 def pick_substring(header: str,
@@ -193,12 +218,14 @@ def pick_substring(header: str,
         if regex is None or regex.lower() == 'q':
             return None
 
-        filtered_options = []
-        for option in options:
-            if regex in option:
-                filtered_options.append(option)
+        # Compiled once per entered pattern. Input that isn't a valid regex is matched as a literal substring instead.
+        try:
+            pattern = re.compile(regex)
+        except re.error:
+            pattern = re.compile(re.escape(regex))
+        filtered_options = [option for option in options if pattern.search(option)]
         if len(filtered_options) == 0:
-            print('Found no matches for {}.')
+            print('Found no matches for {}.'.format(regex))
         else:
             break
 
@@ -206,7 +233,7 @@ def pick_substring(header: str,
 
 
 def pick_value(header: str,
-               options: List[str],
+               options: Iterable[str],
                allow_exit: bool = True,
                exit_text: str = 'back to previous menu',
                sort: bool = True,
@@ -214,30 +241,35 @@ def pick_value(header: str,
                ) -> Optional[str]:
     """
     :param header: Message to print before options
-    :param options: List of options for user to select from
+    :param options: Options for user to select from. Any iterable, e.g. a dict's keys(), as it's copied or sorted here
     :param allow_exit: whether to allow 'q' option and None return
     :param exit_text: behavior to prompt next to 'q' option (retry, quit back, etc)
     :param sort: Leave input options alone or re-order them
     :param silent: Suppress printing of options.
     :return: Selected option, None if 'q' selected
     """
+    # Copied once up front, as a one-shot iterator would be exhausted by the first sort attempt
+    options = list(options)
     try:
         sorted_options = sorted(options, key=lambda s: s.lower()) if sort else options
     except AttributeError:
         # int or something that doesn't like s.lower
-        sorted_options = sorted(options) if sort else options
+        sorted_options = sorted(options)
 
     num_options = len(sorted_options)
     option_width = len(str(num_options))
     format_str = '{:>%d} : {}' % option_width
 
+    # Rendered once, then reprinted in a single call on each retry
+    lines = [header]
+    if not silent:
+        lines.extend(format_str.format(option_num, option) for option_num, option in enumerate(sorted_options, start=1))
+    if allow_exit:
+        lines.append(format_str.format('q', 'quit ({})'.format(exit_text)))
+    menu = '\n'.join(lines)
+
     while True:
-        print(header)
-        if not silent:
-            for option_num, option in enumerate(sorted_options, start=1):
-                print(format_str.format(option_num, option))
-        if allow_exit:
-            print(format_str.format('q', 'quit ({})'.format(exit_text)))
+        print(menu)
         choice = get_input('>')
         if allow_exit and choice == 'q':
             return None
@@ -262,13 +294,8 @@ def display_results(results: List[str], sort: bool = True) -> None:
 
 
 def decode(key: str, enc: str) -> str:
-    dec = []
     enc = base64.urlsafe_b64decode(enc).decode()
-    for i in range(len(enc)):
-        key_c = key[i % len(key)]
-        dec_c = chr((256 + ord(enc[i]) - ord(key_c)) % 256)
-        dec.append(dec_c)
-    return ''.join(dec)
+    return bytes((256 + ord(c) - ord(key_c)) % 256 for c, key_c in zip(enc, cycle(key))).decode('latin-1')
 
 
 def build_config_file(directory: str, file_name: str) -> str:
@@ -312,8 +339,7 @@ class Config:
         if unit_test:
             directories = [os.path.join(TEST_DIR, d) for d in directories]
         for directory in directories:
-            if not os.path.exists(directory):
-                os.mkdir(directory)
+            os.makedirs(directory, exist_ok=True)
 
     @staticmethod
     def _init_jenkins_config() -> None:
@@ -327,15 +353,21 @@ class Config:
         config_parser = configparser.RawConfigParser()
         config_parser.read(conf_path)
 
+        # Only written back when a default had to be filled in, so a complete config isn't rewritten on every start
+        dirty = False
         if not config_parser.has_section(build_options_str):
             config_parser.add_section(build_options_str)
+            dirty = True
         if not config_parser.has_option(build_options_str, builds_to_check_str):
             config_parser.set(build_options_str, builds_to_check_str, str(30))
+            dirty = True
         if not config_parser.has_option(build_options_str, recent_str):
             config_parser.set(build_options_str, recent_str, str(3))
+            dirty = True
 
-        with open(conf_path, 'w') as config_file:
-            config_parser.write(config_file)
+        if dirty:
+            with open(conf_path, 'w') as config_file:
+                config_parser.write(config_file)
 
     @staticmethod
     def _init_custom_config() -> None:
@@ -352,17 +384,27 @@ class Config:
             config_parser.read(custom_params_path)
             Config.JENKINS_URL = config_parser.get('JENKINS', 'url').rstrip('/')
             Config.JENKINS_BRANCHES = config_parser.get('JENKINS', 'branches').split(',')
-            Config.JENKINS_PROJECT = list(config_parser.get('JENKINS', 'project_name'))
+            Config.JENKINS_PROJECT = config_parser.get('JENKINS', 'project_name').split(',')
 
 
 def get_build_options() -> Tuple[int, int]:
+    """
+    Parsed from jenkins.cfg on first call and again only once the file's path or mtime changes, as this is asked for per
+    job during jenkins downloads
+    """
+    global _build_options_cache
+    conf_path = os.path.join(TEST_DIR, jenkins_conf_file) if unit_test else jenkins_conf_file
+    # A missing file is never cached, and fails below on the missing section as it always has
+    cache_key = (conf_path, os.path.getmtime(conf_path)) if os.path.exists(conf_path) else None
+    if cache_key is not None and _build_options_cache is not None and _build_options_cache[0] == cache_key:
+        return _build_options_cache[1]
+
     config_parser = configparser.RawConfigParser()
-    if unit_test:
-        config_parser.read(os.path.join(TEST_DIR, jenkins_conf_file))
-    else:
-        config_parser.read(jenkins_conf_file)
+    config_parser.read(conf_path)
     builds_to_check = config_parser.getint(build_options_str, builds_to_check_str)
     recent_builds_to_check = config_parser.getint(build_options_str, recent_str)
+    if cache_key is not None:
+        _build_options_cache = (cache_key, (builds_to_check, recent_builds_to_check))
     return builds_to_check, recent_builds_to_check
 
 
@@ -397,13 +439,24 @@ def print_separator(count: int, char: str = '-') -> None:
 
 
 def argus_debug(value: str) -> None:
-    if debug:
-        print('DEBUG: {}'.format(value))
-        if argus_log is None:
-            return
+    if not debug:
+        return
+    print('DEBUG: {}'.format(value))
+    if argus_log is not None:
         argus_log.write(str(value.encode('utf-8')) + os.linesep)
 
 
+def open_argus_log() -> None:
+    """
+    Opens argus.log for argus_debug, unless it's already open. Writes go through a larger buffer than the default, so
+    verbose runs don't hit the disk per debug line; the file is closed, and so flushed, when argus exits.
+    """
+    global argus_log
+    if argus_log is None:
+        argus_log = open('argus.log', 'w', buffering=64 * 1024)
+        atexit.register(argus_log.close)
+
+
 def as_int(value: str) -> Optional[int]:
     if value == '':
         return None
@@ -431,6 +484,15 @@ def load_file(tpl: Tuple[Any, Any, Any]) -> None:
         print(e)
 
 
+def list_files(directory: str, suffix: str) -> List[str]:
+    """
+    Paths of the regular files in directory ending in suffix. Uses os.scandir, whose entries carry their file type, so
+    no extra stat per file is needed.
+    """
+    with os.scandir(directory) as entries:
+        return [entry.path for entry in entries if entry.name.endswith(suffix) and entry.is_file()]
+
+
 def get_connection_name(filename: str) -> str:
     """
     Get the name of a connection from the name of its data file.
@@ -438,33 +500,34 @@ def get_connection_name(filename: str) -> str:
     :param filename: The name of the serialized data file
     :return: The connection name
     """
-    path_str = glob(filename)[0]
-    filename_str = path_str.split('/')[-1]
+    # Only a pattern needs resolving against the file system; a concrete path is used as is
+    path_str = glob(filename)[0] if any(c in filename for c in '*?[') else filename
+    filename_str = os.path.basename(path_str)
     connection_name = filename_str.split('.')[0]
 
     return connection_name
 
 
 class MultiTasker:
-    def __init__(self, max_threads: int = 5, stagger_time: float = .2, pause_time: int = 1) -> None:
+    def __init__(self, max_threads: int = 5, stagger_time: float = .2) -> None:
         """
         Runs jobs asynchronously
         :param max_threads: The max # of threads allowed at a time
         :param stagger_time: The explicit time to wait between running threads
-        :param pause_time: The amount of time to wait if the max # of threads are running
         """
-        self.running_count = 0
         self.max_threads = max_threads
         self.stagger = stagger_time
-        self.pause = pause_time
         self.threads = []  # type: List[threading.Thread]
 
+        # Held by each running job. run() acquires a slot before starting a thread and the job releases it when done, so
+        # run() blocks until a slot frees up rather than polling a count.
+        self._slots = threading.BoundedSemaphore(max_threads)
+
     def wrap_job(self, target: Callable, args: tuple):
-        with threading.Lock():
-            self.running_count += 1
-        target(*args)
-        with threading.Lock():
-            self.running_count -= 1
+        try:
+            target(*args)
+        finally:
+            self._slots.release()
 
     def add_job(self, target: Callable, args: tuple):
         thread = threading.Thread(target=self.wrap_job, args=(target, args))
@@ -472,8 +535,7 @@ class MultiTasker:
 
     def run(self) -> None:
         for thread in self.threads:
-            while self.running_count >= self.max_threads:
-                time.sleep(self.pause)
+            self._slots.acquire()
             thread.start()
             time.sleep(self.stagger)
 
@@ -501,7 +563,12 @@ def clear_tab_complete_vocabulary() -> None:
     readline.set_completer(completer)
 
 
+@lru_cache(maxsize=128)
 def build_regex_pattern(str_to_build: str):
+    """
+    Turns a bash-like wildcard string into a compiled pattern. Other regex syntax in the input is kept, so entries such
+    as job-[ab]* still work. Cached, as tab completion asks for the same pattern on every completion of an entry.
+    """
     pattern = r"{}$".format(str_to_build.replace("*", "(.*?)"))
     return re.compile(pattern)
 
@@ -514,11 +581,16 @@ def tab_complete(func: Callable, args: tuple, word_list: List[str], regex: bool
     :param word_list: Vocabulary to be passed to the readline module for tab completion
     :param regex: When True, bash-like asterisks are supported (ie job-name-*)
     :param cleanup: When True, vocabulary will be reset upon completion (prevents inaccurate tab completions)
-    :return: list of selection matches, if only one match a list will still be returned
+    :return: The entered value or, for a wildcard entry with regex set, the first word in word_list it matches
     """
+    # readline calls completer with state 0, 1, 2... for the same text until it gets None, so the matches for a text
+    # are computed once at state 0 and served from here for the rest
+    matches = []  # type: List[str]
+
     def completer(text: str, state: int) -> Optional[str]:
-        options = [word for word in word_list if word.startswith(text)]
-        return options[state] if state < len(options) else None
+        if state == 0:
+            matches[:] = [word for word in word_list if word.startswith(text)]
+        return matches[state] if state < len(matches) else None
 
     readline.set_completer(completer)
     value = func(args)
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import os
+from functools import lru_cache
 from unittest import TestCase
 
 import dill
@@ -20,6 +22,15 @@ from src import utils; utils.unit_test = True
 from tests.utils import clean_test_files
 
 
+@lru_cache(maxsize=None)
+def _load_builds_cached(path):
+    """
+    Each .dat file is only read and unpickled once per test run. Callers get a copy through Tester.get_builds_from_file.
+    """
+    with open(path, 'rb') as file_handle:
+        return dill.load(file_handle)
+
+
 class Tester(TestCase):
     DATA_DIR = os.path.join(os.path.dirname(__file__), 'test_data')
     JOB_INSTANCES_DIR = os.path.join(DATA_DIR, 'job_instances')
@@ -35,10 +46,9 @@ class Tester(TestCase):
 
     @staticmethod
     def get_builds_from_file(filename):
-        path = os.path.join(Tester.DATA_DIR, filename)
-        with open(path, 'rb') as file_handle:
-            builds = dill.load(file_handle)
-        return builds
+        path = os.path.abspath(os.path.join(Tester.DATA_DIR, filename))
+        # Deep copied so no test can mutate the cached builds out from under another
+        return copy.deepcopy(_load_builds_cached(path))
 
     @staticmethod
     def create_builds_dict(builds):
@@ -28,35 +28,12 @@ class TestJenkinsJobMethods(Tester):
 
     def test_get_job_health(self):
         """Test all the different possible inputs to the get_job_health static method."""
-        health = JenkinsJob._get_job_health(failed_builds=3, builds_checked=3)
-        self.assertEqual(health, 'BAD')
-
-        health = JenkinsJob._get_job_health(failed_builds=2, builds_checked=3)
-        self.assertEqual(health, 'BAD')
-
-        health = JenkinsJob._get_job_health(failed_builds=1, builds_checked=3)
-        self.assertEqual(health, 'FAIR')
-
-        health = JenkinsJob._get_job_health(failed_builds=0, builds_checked=3)
-        self.assertEqual(health, 'GOOD')
-
-        health = JenkinsJob._get_job_health(failed_builds=2, builds_checked=2)
-        self.assertEqual(health, 'BAD')
-
-        health = JenkinsJob._get_job_health(failed_builds=1, builds_checked=2)
-        self.assertEqual(health, 'FAIR')
-
-        health = JenkinsJob._get_job_health(failed_builds=0, builds_checked=2)
-        self.assertEqual(health, 'GOOD')
-
-        health = JenkinsJob._get_job_health(failed_builds=1, builds_checked=1)
-        self.assertEqual(health, 'BAD')
-
-        health = JenkinsJob._get_job_health(failed_builds=0, builds_checked=1)
-        self.assertEqual(health, 'GOOD')
-
-        health = JenkinsJob._get_job_health(failed_builds=0, builds_checked=0)
-        self.assertEqual(health, 'N/A')
+        cases = [(3, 3, 'BAD'), (2, 3, 'BAD'), (1, 3, 'FAIR'), (0, 3, 'GOOD'), (2, 2, 'BAD'), (1, 2, 'FAIR'),
+                 (0, 2, 'GOOD'), (1, 1, 'BAD'), (0, 1, 'GOOD'), (0, 0, 'N/A')]
+        for failed_builds, builds_checked, expected in cases:
+            with self.subTest(failed_builds=failed_builds, builds_checked=builds_checked):
+                health = JenkinsJob._get_job_health(failed_builds=failed_builds, builds_checked=builds_checked)
+                self.assertEqual(health, expected)
 
     def test_get_build_failures(self):
         """Tests that the correct number of build failures are counted by get_build_failures."""
@@ -82,52 +59,15 @@ class TestJenkinsJobConstructor(Tester):
         self.apply_assertions(jenkins_job, builds_dict)
 
     def test_creation_of_jenkins_job_with_builds(self):
-        """Test that a new Jenkins job can be created with a list of builds."""
-        builds = self.get_builds_from_file('builds/builds.dat')
-        builds_dict = self.create_builds_dict(builds)
-
-        jenkins_job = JenkinsJob(self.job_name, builds)
-        self.apply_assertions(jenkins_job, builds_dict)
-
-    def test_creation_of_jenkins_job_with_aborted_build(self):
-        """Test that a new Jenkins job can be created with a build with ABORTED status."""
-        builds = self.get_builds_from_file('builds/build_ABORTED.dat')
-        builds_dict = self.create_builds_dict(builds)
-
-        jenkins_job = JenkinsJob(self.job_name, builds)
-        self.apply_assertions(jenkins_job, builds_dict)
-
-    def test_creation_of_jenkins_job_with_failed_build(self):
-        """Test that a new Jenkins job can be created with a build with FAILURE status."""
-        builds = self.get_builds_from_file('builds/build_FAILURE.dat')
-        builds_dict = self.create_builds_dict(builds)
-
-        jenkins_job = JenkinsJob(self.job_name, builds)
-        self.apply_assertions(jenkins_job, builds_dict)
-
-    def test_creation_of_jenkins_job_with_in_progress_build(self):
-        """Test that a new Jenkins job can be created with a build with IN_PROGRESS status."""
-        builds = self.get_builds_from_file('builds/build_IN_PROGRESS.dat')
-        builds_dict = self.create_builds_dict(builds)
-
-        jenkins_job = JenkinsJob(self.job_name, builds)
-        self.apply_assertions(jenkins_job, builds_dict)
-
-    def test_creation_of_jenkins_job_with_successful_build(self):
-        """Test that a new Jenkins job can be created with a build with SUCCESS status."""
-        builds = self.get_builds_from_file('builds/build_SUCCESS.dat')
-        builds_dict = self.create_builds_dict(builds)
-
-        jenkins_job = JenkinsJob(self.job_name, builds)
-        self.apply_assertions(jenkins_job, builds_dict)
-
-    def test_creation_of_jenkins_job_with_unstable_build(self):
-        """Test that a new Jenkins job can be created with a build with UNSTABLE status."""
-        builds = self.get_builds_from_file('builds/build_UNSTABLE.dat')
-        builds_dict = self.create_builds_dict(builds)
-
-        jenkins_job = JenkinsJob(self.job_name, builds)
-        self.apply_assertions(jenkins_job, builds_dict)
+        """Test that a new Jenkins job can be created from a list of builds and from a build of each status."""
+        for build_file in ['builds/builds.dat', 'builds/build_ABORTED.dat', 'builds/build_FAILURE.dat',
+                           'builds/build_IN_PROGRESS.dat', 'builds/build_SUCCESS.dat', 'builds/build_UNSTABLE.dat']:
+            with self.subTest(build_file=build_file):
+                builds = self.get_builds_from_file(build_file)
+                builds_dict = self.create_builds_dict(builds)
+
+                jenkins_job = JenkinsJob(self.job_name, builds)
+                self.apply_assertions(jenkins_job, builds_dict)
 
     def apply_assertions(self, jenkins_job, jenkins_builds):
         self.assertIsInstance(jenkins_job, JenkinsJob,
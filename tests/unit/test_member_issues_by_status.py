@@ -0,0 +1,64 @@
+# Copyright 2018 DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from types import SimpleNamespace
+
+from src.jira_issue import JiraIssue
+from src.member_issues_by_status import JiraUserName, MemberIssuesByStatus
+from tests.argus_test import Tester
+
+
+class StubJiraProject:
+    @staticmethod
+    def translate_custom_field(field_name):
+        return {'reviewer': 'customfield_1', 'reviewer2': 'customfield_2'}.get(field_name, field_name)
+
+
+class StubJiraConnection:
+    connection_name = 'test_connection'
+
+    @staticmethod
+    def maybe_get_cached_jira_project(project_name):
+        return StubJiraProject()
+
+
+class TestMemberIssuesByStatus(Tester):
+    @staticmethod
+    def build_issue(key, assignee, reviewer, resolution=None):
+        jira_issue = JiraIssue(None, SimpleNamespace(key=key, fields=None))
+        jira_issue['assignee'] = assignee
+        jira_issue['customfield_1'] = reviewer
+        jira_issue['resolution'] = resolution
+        return jira_issue
+
+    def test_attach_to_owners_alias_lookup_order(self):
+        """
+        Tests that a member known by two names on one connection takes its role from the first name, aliases before
+        the primary name, that is assignee or reviewer on the issue.
+        """
+        member = MemberIssuesByStatus(JiraUserName('bob', 'test_connection', 'team'))
+        member.add_alias(JiraUserName('robert', 'test_connection', 'team'))
+        other = MemberIssuesByStatus(JiraUserName('carol', 'test_connection', 'team'))
+        owner_index = MemberIssuesByStatus.build_owner_index([member, other])
+
+        issues = [self.build_issue('TEST-1', 'bob', 'robert'),
+                  self.build_issue('TEST-2', 'robert', 'bob'),
+                  self.build_issue('TEST-3', 'bob', None, resolution='Fixed'),
+                  self.build_issue('TEST-4', 'carol', 'bob')]
+        MemberIssuesByStatus.attach_to_owners(owner_index, StubJiraConnection(), issues)
+
+        self.assertEqual([x.issue_key for x in member.reviewer], ['TEST-1', 'TEST-4'])
+        self.assertEqual([x.issue_key for x in member.assigned], ['TEST-2'])
+        self.assertEqual([x.issue_key for x in member.closed], ['TEST-3'])
+        self.assertEqual([x.issue_key for x in other.assigned], ['TEST-4'])
@@ -0,0 +1,115 @@
+# Copyright 2018 DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import configparser
+import os
+from unittest import mock
+
+from src.member_issues_by_status import JiraUserName, MemberIssuesByStatus
+from src.team import Team
+from src.team_manager import TeamManager
+from src.utils import TEST_DIR
+from tests.argus_test import Tester
+
+
+class TestTeamManagerConfig(Tester):
+    def setUp(self):
+        super().setUp()
+        # from_file reads conf_dir directly, so point both it and _save_config at the test conf folder
+        self.conf_dir = os.path.join(TEST_DIR, 'conf')
+        self.config_path = os.path.join(self.conf_dir, 'teams.cfg')
+        patcher = mock.patch('src.team_manager.conf_dir', self.conf_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def build_team_manager():
+        team_manager = TeamManager()
+        team = Team('Core', 'conn_a')
+        member = MemberIssuesByStatus(JiraUserName('alice', 'conn_a', 'Core'))
+        member.add_alias(JiraUserName('al', 'conn_b', 'Core'))
+        member.add_alias(JiraUserName('alice.smith', 'conn_a', 'Core'))
+        team.add_existing_member(member)
+        team.add_existing_member(MemberIssuesByStatus(JiraUserName('bob', 'conn_a', 'Core')))
+        team_manager.add_existing_team(team)
+        team_manager.add_existing_team(Team('Tools', 'conn_b'))
+        return team_manager
+
+    @staticmethod
+    def describe(team_manager):
+        teams = sorted((team.root_name, sorted(str(member) for member in team.members))
+                       for team in team_manager._teams.values())
+        organizations = sorted((name, sorted(team_names)) for name, team_names in team_manager._organizations.items())
+        return teams, organizations
+
+    def test_round_trip(self):
+        """
+        Tests that teams.cfg written by _save_config loads back into the same teams, members, aliases and orgs, and
+        that the single pass reader agrees with RawConfigParser on the written file.
+        """
+        team_manager = self.build_team_manager()
+        team_manager._organizations['MixedCase'] = {'Core', 'Tools'}
+        team_manager._organizations['Empty'] = set()
+        team_manager._save_config()
+
+        loaded = TeamManager.from_file()
+        # An org with no teams has always loaded back holding a single empty team name
+        team_manager._organizations['Empty'] = {''}
+        self.assertEqual(self.describe(loaded), self.describe(team_manager))
+        content = self.read_config()
+        self.assertEqual(TeamManager._read_config_sections(content), TeamManager._read_config_sections_fallback(content))
+
+    def read_config(self):
+        with open(self.config_path) as config_file:
+            return config_file.read()
+
+    def test_option_key_case(self):
+        """
+        Tests that option names are lowercased like RawConfigParser, including on hand edited files that fall back to it.
+        """
+        content = ('[manager]\nTeam_Names = Core:conn_a\n\n'
+                   '[alice:conn_a:Core]\nALIASES = al:conn_b:Core\n\n'
+                   '[organizations]\norg_names = MyOrg\nMyOrg = Core\n')
+        sections = TeamManager._read_config_sections(content)
+        self.assertEqual(sections, TeamManager._read_config_sections_fallback(content))
+        self.assertEqual(sections['organizations']['myorg'], 'Core')
+        self.assertEqual(sections['alice:conn_a:Core']['aliases'], 'al:conn_b:Core')
+        self.assertEqual(TeamManager._read_config_sections(content + '# trailing comment\n'), sections)
+
+    def test_fallback_layouts(self):
+        """
+        Tests that ':' delimiters and repeated sections or options parse, or fail, exactly as they do in RawConfigParser.
+        """
+        content = '[manager]\nteam_names: Core:conn_a=x\n'
+        self.assertEqual(TeamManager._read_config_sections(content), {'manager': {'team_names': 'Core:conn_a=x'}})
+        for content in ['[manager]\nteam_names = a\n[manager]\nteam_names = b\n',
+                        '[manager]\nteam_names = a\nTEAM_NAMES = b\n']:
+            with self.assertRaises(configparser.Error):
+                TeamManager._read_config_sections(content)
+
+    def test_save_if_dirty(self):
+        """
+        Tests that _save_if_dirty only writes teams.cfg once an edit marks the manager dirty, and clears the flag.
+        """
+        team_manager = self.build_team_manager()
+        team_manager._save_if_dirty()
+        self.assertFalse(os.path.exists(self.config_path))
+
+        team_manager._dirty = True
+        team_manager._save_if_dirty()
+        self.assertTrue(os.path.exists(self.config_path))
+        self.assertFalse(team_manager._dirty)
+
+        loaded = TeamManager.from_file()
+        self.assertEqual(self.describe(loaded), self.describe(team_manager))
@@ -0,0 +1,46 @@
+# Copyright 2018 DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+
+from dateutil import parser
+
+from tests.argus_test import Tester
+
+
+class TestTimeUtils(Tester):
+    def test_parse_jira_time(self):
+        """
+        Tests that parse_jira_time matches dateutil on JIRA timestamps and on input outside the JIRA layout.
+        """
+        from src.time_utils import parse_jira_time
+
+        for value in ['2016-12-12T08:58:11.588-0600', '2019-03-01T10:00:00.000+0000', '2016-12-12T08:58:11.588+0530',
+                      '2016-12-12 08:58', '2016-12-12']:
+            parsed = parse_jira_time(value)
+            expected = parser.parse(value)
+            self.assertEqual(parsed, expected, 'Mismatched parse of {}'.format(value))
+            self.assertEqual(parsed.utcoffset(), expected.utcoffset(), 'Mismatched UTC offset for {}'.format(value))
+
+    def test_since(self):
+        """
+        Tests that since applies each unit offset in the delta string.
+        """
+        from src.time_utils import since
+
+        source = datetime(2018, 6, 15)
+        self.assertEqual(since(source, '-2d'), datetime(2018, 6, 13))
+        self.assertEqual(since(source, '-1w -2m'), datetime(2018, 4, 8))
+        self.assertEqual(since(source, '-1y'), datetime(2017, 6, 15))
+        self.assertEqual(since(source, 'nothing'), source)
@@ -29,3 +29,13 @@ class TestUtils(Tester):
 
         self.assertEqual(connection_name, 'connection_name',
                          "The filename has not been parsed correctly.")
+
+    def test_encode_decode(self):
+        """
+        Tests that encode keeps the stored password format and that decode reverses it.
+        """
+        from src.utils import decode, encode
+
+        for key, value, encoded in [('key', 'p@ssw0rd', 'w5vCpcOsw57DnMKpw53DiQ=='), ('argus', 'ÿé~ü é', 'YFvDpXHCk0o=')]:
+            self.assertEqual(encode(key, value), encoded, 'Encoded format changed for {}'.format(value))
+            self.assertEqual(decode(key, encoded), value, 'Failed to decode {}'.format(encoded))
@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import os
 import shutil
 from configparser import ConfigParser
+from functools import lru_cache
 from src.utils import TEST_DIR
 
 
@@ -22,28 +24,32 @@ def clean_test_files():
     """
     Deletes any files that could have been created by running tests
     """
-    test_conf_path = os.path.join(TEST_DIR, 'conf')
-    test_data_path = os.path.join(TEST_DIR, 'data')
     deleted_folders = False
 
-    if os.path.exists(test_conf_path):
-        print('Removing path {} from previous test'.format(test_conf_path))
+    # Only the generated conf and data trees are removed; TEST_DIR itself holds the test sources. rmtree is attempted
+    # directly rather than after an exists check.
+    for test_path in (os.path.join(TEST_DIR, 'conf'), os.path.join(TEST_DIR, 'data')):
+        try:
+            shutil.rmtree(test_path)
+        except FileNotFoundError:
+            continue
+        print('Removed path {} from previous test'.format(test_path))
         deleted_folders = True
-        shutil.rmtree(test_conf_path)
-
-    if os.path.exists(test_data_path):
-        print('Removing path {} from previous test'.format(test_data_path))
-        deleted_folders = True
-        shutil.rmtree(test_data_path)
 
     if not deleted_folders:
-        print('Test directory, "{}", is clean')
+        print('Test directory, "{}", is clean'.format(TEST_DIR))
         print('No files removed')
 
 
 def parser_to_dict(filename):
     if not os.path.exists(filename):
         raise Exception('{} does not exist'.format(filename))
+    # Keyed on mtime so a rewritten conf is parsed again; copied so callers can't mutate the cached dict
+    return copy.deepcopy(_parse_cached(os.path.abspath(filename), os.path.getmtime(filename)))
+
+
+@lru_cache(maxsize=128)
+def _parse_cached(filename, mtime):
     cp = ConfigParser()
     cp.read(filename)
     data = {}
@@ -55,4 +61,4 @@ def parser_to_dict(filename):
 
 
 def csv_to_list(row):
-    return sorted(filter(None, [r for r in row.split(',')]))
+    return sorted(r for r in row.split(',') if r)